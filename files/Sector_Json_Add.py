@@ -1,8 +1,68 @@
+"""
+Quick Tick Sector Enrichment
+
+Adds exchange, country, sector and subIndustry from Finnhub company profiles
+to every ticker in company_lookup.json and writes company_lookup_enhanced.json.
+
+Profiles are fetched by a small thread pool through finnhub_client.py (one
+pooled session, token bucket paced to the per-minute quota), instead of one
+unpooled request and a fixed one-second sleep per ticker. Finished tickers
+are appended to CHECKPOINT_FILE as they complete, so an interrupted run
+resumes where it stopped; tickers whose request failed are not checkpointed
+and are retried by the next run. The checkpoint is removed once every
+ticker has been enriched. Profiles fetched within the cache TTL
+(finnhub_cache.py) are not requested again.
+
+--incremental is the routine refresh. Instead of re-enriching everything
+into a new file to copy over by hand, it diffs the holdings CSV, the live
+company_lookup.json and company_lookup_enhanced.json, and only looks up
+tickers that are new in the holdings or have sector/subIndustry/exchange
+missing in the lookup. Values an earlier full run already found in the
+enhanced file are reused without an API call; the rest are fetched. Results
+only fill gaps (hand-edited values are never overwritten) and are written
+into company_lookup.json atomically. Tickers dropped from the holdings are
+reported but kept, since their reports are still published.
+
+Test against the mock server:
+    python mock_api_server.py --latency 0.05 --rpm 600
+    FINNHUB_BASE_URL=http://127.0.0.1:8765/api/v1 python Sector_Json_Add.py
+
+Usage:
+    python Sector_Json_Add.py                 # resume from the checkpoint if there is one
+    python Sector_Json_Add.py --fresh         # discard the checkpoint and start over
+    python Sector_Json_Add.py --workers 8
+    python Sector_Json_Add.py --fresh --max-age 0   # re-fetch every profile
+    python Sector_Json_Add.py --incremental --dry-run   # show what a refresh would change
+    python Sector_Json_Add.py --incremental             # enrich new/incomplete tickers in place
+"""
+
+import argparse
 import json
-import requests
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import requests
 
-FINNHUB_API_KEY = 'd5n9k69r01ql6sfq9l20d5n9k69r01ql6sfq9l2g'
+from finnhub_client import WORKERS, FinnhubClient
+from issuer_groups import load_holdings
+from report_store import write_text_atomic
+from scheduler import NON_COMPANY_ROWS, TICKER_PATTERN
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+LOOKUP_FILE = 'company_lookup.json'
+OUTPUT_FILE = 'company_lookup_enhanced.json'
+CHECKPOINT_FILE = 'company_lookup_enhanced.partial.jsonl'
+CHECKPOINT_EVERY = 25  # Finished tickers between fsyncs of the checkpoint
+
+# Lookup fields --incremental fills in when they are missing or N/A
+ENRICHED_FIELDS = ('sector', 'subIndustry', 'exchange')
 
 # Map Finnhub industries to standard sectors
 INDUSTRY_TO_SECTOR = {
@@ -68,6 +128,7 @@ INDUSTRY_TO_SECTOR = {
     'REITs': 'Real Estate'
 }
 
+
 def map_industry_to_sector(industry):
     """Map Finnhub industry to standard sector"""
     if not industry:
@@ -85,129 +146,351 @@ def map_industry_to_sector(industry):
     
     return None
 
-# Load existing company_lookup.json
-with open('company_lookup.json', 'r') as f:
-    companies = json.load(f)
 
-# Enhance with exchange, country, AND sector/industry from Finnhub
-enhanced = {}
-success_count = 0
-partial_count = 0
-error_count = 0
-sector_mapped = 0
-total = len(companies)
+# ============================================================================
+# ENRICHMENT
+# ============================================================================
 
-print(f"Starting to process {total} tickers...")
-print("="*60)
+def fallback_record(ticker, data):
+    """The existing data, for tickers Finnhub has nothing on"""
+    return {
+        'name': data.get('name', ticker),
+        'sector': data.get('sector', 'N/A'),
+        'subIndustry': data.get('subIndustry', 'N/A'),
+        'exchange': 'N/A',
+        'country': 'USA'
+    }
 
-for index, (ticker, data) in enumerate(companies.items(), 1):
-    print(f"[{index}/{total}] {ticker}...", end=" ")
-    
+
+def enhance_record(ticker, data, profile):
+    """
+    Merge a Finnhub profile into a lookup record.
+
+    Returns:
+        tuple: (record, status, sector_mapped) - status is "complete", "partial"
+        or "empty" (no profile)
+    """
+    if not profile or 'name' not in profile:
+        return fallback_record(ticker, data), "empty", False
+
+    finnhub_industry = profile.get('finnhubIndustry', '')
+
+    # Determine sector (use existing if available, otherwise map from Finnhub)
+    sector = data.get('sector')
+    sector_mapped = False
+    if not sector or sector == 'N/A':
+        sector = map_industry_to_sector(finnhub_industry)
+        sector_mapped = sector is not None
+        sector = sector or 'N/A'
+
+    # Determine subIndustry (use existing if available, otherwise use Finnhub)
+    sub_industry = data.get('subIndustry')
+    if not sub_industry or sub_industry == 'N/A':
+        sub_industry = finnhub_industry if finnhub_industry else 'N/A'
+
+    record = {
+        'name': profile.get('name', data.get('name', ticker)),
+        'sector': sector,
+        'subIndustry': sub_industry,
+        'exchange': profile.get('exchange', 'N/A'),
+        'country': profile.get('country', 'USA')
+    }
+    complete = (sector != 'N/A' and sub_industry != 'N/A' and
+                profile.get('exchange') and profile.get('country'))
+    return record, "complete" if complete else "partial", sector_mapped
+
+
+def enrich_ticker(client, ticker, data, max_age_days=None):
+    """
+    Fetch and merge one ticker's profile.
+
+    Returns:
+        dict: checkpoint entry (ticker, record, status, sector_mapped), with
+        status "error" and the reason when the request failed
+    """
+    try:
+        profile = client.profile(ticker, max_age_days)
+    except requests.RequestException as e:
+        status = getattr(e.response, 'status_code', None)
+        return {"ticker": ticker, "record": fallback_record(ticker, data), "status": "error",
+                "sector_mapped": False, "error": str(status) if status else str(e)[:40]}
+
+    record, status, sector_mapped = enhance_record(ticker, data, profile)
+    return {"ticker": ticker, "record": record, "status": status, "sector_mapped": sector_mapped}
+
+
+class Checkpoint:
+    """Append-only JSONL of finished tickers, safe to share between threads"""
+
+    def __init__(self, path=CHECKPOINT_FILE):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+        self._unsynced = 0
+
+    def load(self):
+        """Finished entries by ticker (a torn last line from a crash is ignored)"""
+        entries = {}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        entries[entry["ticker"]] = entry
+                    except (json.JSONDecodeError, KeyError):
+                        continue
+        return entries
+
+    def add(self, entry):
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._unsynced += 1
+            if self._unsynced >= CHECKPOINT_EVERY:
+                self._sync()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
+
+    def remove(self):
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+# ============================================================================
+# INCREMENTAL MODE
+# ============================================================================
+
+def is_missing(value):
+    return value in (None, '', 'N/A')
+
+
+def missing_fields(record):
+    """ENRICHED_FIELDS a lookup record has no value for"""
+    return [field for field in ENRICHED_FIELDS if is_missing(record.get(field))]
+
+
+def fill_missing(record, source):
+    """
+    Copy the fields record is missing from source, never overwriting a value.
+
+    Returns:
+        list: the fields that were filled
+    """
+    filled = []
+    for field in missing_fields(record):
+        if not is_missing(source.get(field)):
+            record[field] = source[field]
+            filled.append(field)
+    return filled
+
+
+def plan_incremental(companies, holdings, enhanced):
+    """
+    Diff the live lookup against the holdings and the last enhanced output.
+
+    Returns:
+        tuple: (added, incomplete, removed) - added maps new holdings to seed
+        records, incomplete lists lookup tickers with missing fields, removed
+        lists lookup companies no longer in the holdings
+    """
+    added = {}
+    for ticker, row in holdings.items():
+        if ticker not in companies:
+            seed = fallback_record(ticker, row)
+            fill_missing(seed, enhanced.get(ticker, {}))
+            added[ticker] = seed
+
+    incomplete = [ticker for ticker, record in companies.items()
+                  if TICKER_PATTERN.fullmatch(ticker) and ticker not in NON_COMPANY_ROWS
+                  and missing_fields(record)]
+    removed = [ticker for ticker in companies
+               if TICKER_PATTERN.fullmatch(ticker) and ticker not in NON_COMPANY_ROWS
+               and ticker not in holdings]
+    return added, incomplete, removed
+
+
+def run_incremental(args):
+    """Enrich only new and incomplete tickers and merge them into the live lookup"""
+    with open(LOOKUP_FILE, 'r', encoding='utf-8') as f:
+        companies = json.load(f)
+    enhanced = {}
+    if Path(OUTPUT_FILE).exists():
+        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+            enhanced = json.load(f)
+    holdings = load_holdings()
+
+    added, incomplete, removed = plan_incremental(companies, holdings, enhanced)
+    merged = {ticker: dict(record) for ticker, record in companies.items()}
+    merged.update(added)
+
+    # Gaps an earlier full run already filled in the enhanced file cost no API call
+    from_enhanced = 0
+    for ticker in incomplete:
+        if fill_missing(merged[ticker], enhanced.get(ticker, {})):
+            from_enhanced += 1
+    pending = [ticker for ticker in list(added) + incomplete if missing_fields(merged[ticker])]
+
+    print(f"Holdings: {len(holdings)} | lookup: {len(companies)} | enhanced: {len(enhanced)}")
+    print(f"+ New tickers: {len(added)}" + (f" ({', '.join(list(added)[:10])}"
+                                            f"{', ...' if len(added) > 10 else ''})" if added else ""))
+    print(f"⚠ Missing fields: {len(incomplete)} ({from_enhanced} filled from {OUTPUT_FILE})")
+    if removed:
+        print(f"- No longer in holdings (kept): {len(removed)}")
+    print(f"→ To look up: {len(pending)}")
+    print("="*60)
+
+    if args.dry_run:
+        for ticker in pending:
+            print(f"  {ticker}: {', '.join(missing_fields(merged[ticker]))}")
+        print("\n(dry run - nothing fetched or written)")
+        return
+
+    client = FinnhubClient(workers=args.workers)
+    counts = {}
     try:
-        # Get Finnhub profile
-        response = requests.get(
-            f'https://finnhub.io/api/v1/stock/profile2',
-            params={'symbol': ticker, 'token': FINNHUB_API_KEY}
-        )
-        
-        if response.status_code == 200:
-            profile = response.json()
-            
-            if profile and 'name' in profile:
-                # Get Finnhub industry
-                finnhub_industry = profile.get('finnhubIndustry', '')
-                
-                # Determine sector (use existing if available, otherwise map from Finnhub)
-                sector = data.get('sector')
-                if not sector or sector == 'N/A':
-                    sector = map_industry_to_sector(finnhub_industry)
-                    if sector:
-                        sector_mapped += 1
-                    else:
-                        sector = 'N/A'
-                
-                # Determine subIndustry (use existing if available, otherwise use Finnhub)
-                sub_industry = data.get('subIndustry')
-                if not sub_industry or sub_industry == 'N/A':
-                    sub_industry = finnhub_industry if finnhub_industry else 'N/A'
-                
-                enhanced[ticker] = {
-                    'name': profile.get('name', data.get('name', ticker)),
-                    'sector': sector,
-                    'subIndustry': sub_industry,
-                    'exchange': profile.get('exchange', 'N/A'),
-                    'country': profile.get('country', 'USA')
-                }
-                
-                # Check quality
-                if (sector != 'N/A' and sub_industry != 'N/A' and 
-                    profile.get('exchange') and profile.get('country')):
-                    print("✓")
-                    success_count += 1
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            futures = [executor.submit(enrich_ticker, client, ticker, merged[ticker], args.max_age)
+                       for ticker in pending]
+            for index, future in enumerate(as_completed(futures), 1):
+                entry = future.result()
+                if entry["ticker"] in added and entry["status"] != "error":
+                    # New tickers take the whole record, as a full run would write it
+                    missing = missing_fields(merged[entry["ticker"]])
+                    merged[entry["ticker"]] = entry["record"]
+                    filled = [field for field in missing if not is_missing(entry["record"].get(field))]
                 else:
-                    print("⚠")
-                    partial_count += 1
-            else:
-                # Finnhub returned empty
-                enhanced[ticker] = {
-                    'name': data.get('name', ticker),
-                    'sector': data.get('sector', 'N/A'),
-                    'subIndustry': data.get('subIndustry', 'N/A'),
-                    'exchange': 'N/A',
-                    'country': 'USA'
-                }
-                print("✗")
-                error_count += 1
-        else:
-            # API error
-            enhanced[ticker] = {
-                'name': data.get('name', ticker),
-                'sector': data.get('sector', 'N/A'),
-                'subIndustry': data.get('subIndustry', 'N/A'),
-                'exchange': 'N/A',
-                'country': 'USA'
-            }
-            print(f"✗({response.status_code})")
-            error_count += 1
-        
-        # Rate limiting
-        time.sleep(1)
-        
-    except Exception as e:
-        print(f"✗ {str(e)[:20]}")
-        enhanced[ticker] = {
-            'name': data.get('name', ticker),
-            'sector': data.get('sector', 'N/A'),
-            'subIndustry': data.get('subIndustry', 'N/A'),
-            'exchange': 'N/A',
-            'country': 'USA'
-        }
-        error_count += 1
-    
-    # Progress indicator
-    if index % 100 == 0:
-        elapsed = index  # seconds (since we sleep 1 sec per ticker)
-        remaining = total - index
-        eta_min = remaining // 60
-        print(f"\n--- {index}/{total} ({index*100//total}%) | ETA: ~{eta_min} min ---")
-
-# Save enhanced version
-with open('company_lookup_enhanced.json', 'w') as f:
-    json.dump(enhanced, f, indent=2)
-
-# Final summary
-print("\n" + "="*60)
-print("✅ ENHANCEMENT COMPLETE!")
-print("="*60)
-print(f"Total tickers processed: {len(enhanced)}")
-print(f"✓ Complete data: {success_count}")
-print(f"⚠ Partial data: {partial_count}")
-print(f"✗ Failed/No data: {error_count}")
-print(f"🎯 Sectors mapped from industry: {sector_mapped}")
-print("="*60)
-print("\nOutput: company_lookup_enhanced.json")
-print("\n📋 Next steps:")
-print("1. Review the output file")
-print("2. Backup: company_lookup.json -> company_lookup_backup.json")
-print("3. Replace: company_lookup_enhanced.json -> company_lookup.json")
-print("4. Upload to your website!")
+                    filled = fill_missing(merged[entry["ticker"]], entry["record"])
+                status = "error" if entry["status"] == "error" else ("filled" if filled else "unchanged")
+                counts[status] = counts.get(status, 0) + 1
+                detail = f"✓ {', '.join(filled)}" if filled else ("✗" if status == "unchanged"
+                                                                  else f"✗({entry.get('error')})")
+                print(f"[{index}/{len(pending)}] {entry['ticker']}... {detail}")
+    finally:
+        client.close()
+
+    changed = [ticker for ticker in merged if merged[ticker] != companies.get(ticker)]
+    if changed:
+        write_text_atomic(LOOKUP_FILE, json.dumps(merged, indent=2))
+
+    print("\n" + "="*60)
+    print("✅ INCREMENTAL UPDATE COMPLETE!")
+    print("="*60)
+    print(f"✓ Lookup records updated: {len(changed)} ({len(added)} new)")
+    print(f"✗ Still incomplete: {counts.get('unchanged', 0)}")
+    print(f"✗ Failed requests: {counts.get('error', 0)}" +
+          (" (re-run to retry them)" if counts.get('error') else ""))
+    print(f"💾 Finnhub profiles: {client.cache.stats()}")
+    print("="*60)
+    if changed:
+        print(f"\nUpdated {LOOKUP_FILE} in place - run build_lookup_index.py to refresh the site's lookup files "
+              f"and issuer_groups.py to regroup share classes")
+    else:
+        print(f"\n{LOOKUP_FILE} is already up to date")
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Enrich company_lookup.json with Finnhub profiles")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="concurrent requests")
+    parser.add_argument("--fresh", action="store_true", help="ignore and discard the checkpoint")
+    parser.add_argument("--max-age", type=float, default=None,
+                        help="re-fetch cached profiles older than this many days (0 = ignore the cache)")
+    parser.add_argument("--incremental", action="store_true",
+                        help=f"only enrich new or incomplete tickers and update {LOOKUP_FILE} in place")
+    parser.add_argument("--dry-run", action="store_true", help="with --incremental: show the diff only")
+    args = parser.parse_args()
+
+    if args.incremental:
+        run_incremental(args)
+        return
+
+    # Load existing company_lookup.json
+    with open(LOOKUP_FILE, 'r', encoding='utf-8') as f:
+        companies = json.load(f)
+
+    checkpoint = Checkpoint()
+    if args.fresh:
+        checkpoint.remove()
+    results = {ticker: entry for ticker, entry in checkpoint.load().items() if ticker in companies}
+    pending = [ticker for ticker in companies if ticker not in results]
+    total = len(companies)
+
+    print(f"Starting to process {total} tickers...")
+    if results:
+        print(f"Resuming from {CHECKPOINT_FILE}: {len(results)} already done, {len(pending)} to go")
+    print("="*60)
+
+    client = FinnhubClient(workers=args.workers)
+    start_time = time.time()
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            futures = [executor.submit(enrich_ticker, client, ticker, companies[ticker], args.max_age)
+                       for ticker in pending]
+            for index, future in enumerate(as_completed(futures), 1):
+                entry = future.result()
+                results[entry["ticker"]] = entry
+                marks = {"complete": "✓", "partial": "⚠", "empty": "✗"}
+                mark = marks.get(entry["status"]) or f"✗({entry.get('error')})"
+                print(f"[{index}/{len(pending)}] {entry['ticker']}... {mark}")
+
+                # Failed requests are left out so the next run retries them
+                if entry["status"] != "error":
+                    checkpoint.add(entry)
+
+                # Progress indicator
+                if index % 100 == 0:
+                    rate = index / max(time.time() - start_time, 1e-6)
+                    eta_min = (len(pending) - index) / rate / 60
+                    print(f"\n--- {index}/{len(pending)} ({index*100//len(pending)}%) | ETA: ~{eta_min:.0f} min ---")
+    finally:
+        checkpoint.close()
+        client.close()
+
+    # Save enhanced version, in the lookup's order
+    enhanced = {ticker: results[ticker]["record"] for ticker in companies}
+    write_text_atomic(OUTPUT_FILE, json.dumps(enhanced, indent=2))
+
+    counts = {}
+    for entry in results.values():
+        counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+    sector_mapped = sum(1 for entry in results.values() if entry.get("sector_mapped"))
+    if not counts.get("error"):
+        checkpoint.remove()
+
+    # Final summary
+    print("\n" + "="*60)
+    print("✅ ENHANCEMENT COMPLETE!")
+    print("="*60)
+    print(f"Total tickers processed: {len(enhanced)} in {(time.time() - start_time) / 60:.1f} min")
+    print(f"✓ Complete data: {counts.get('complete', 0)}")
+    print(f"⚠ Partial data: {counts.get('partial', 0)}")
+    print(f"✗ No data: {counts.get('empty', 0)}")
+    print(f"✗ Failed requests: {counts.get('error', 0)}" +
+          (f" (kept out of {CHECKPOINT_FILE} - re-run to retry them)" if counts.get('error') else ""))
+    print(f"🎯 Sectors mapped from industry: {sector_mapped}")
+    print(f"💾 Finnhub profiles: {client.cache.stats()}")
+    print("="*60)
+    print(f"\nOutput: {OUTPUT_FILE}")
+    print("\n📋 Next steps:")
+    print("1. Review the output file")
+    print("2. Backup: company_lookup.json -> company_lookup_backup.json")
+    print("3. Replace: company_lookup_enhanced.json -> company_lookup.json")
+    print("4. Upload to your website!")
+
+
+if __name__ == "__main__":
+    main()
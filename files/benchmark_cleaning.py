@@ -0,0 +1,276 @@
+"""
+Quick Tick Cleaning Benchmark
+
+Checks and times report_cleaning.py against the regex-based
+clean_thinking_text() + enforce_title_format() it replaced.
+
+Every data/*.json report is run through both implementations with both the
+Claude and Grok rules, whole and through the streaming cleaner in random-sized
+chunks. The first --variants reports are also checked in several "dirty"
+forms: thinking preambles, a thinking line mid-report, a missing or malformed
+title, and CRLF line endings. Any output
+that differs from the original functions is reported and the script exits
+with status 1, so it doubles as the golden test for the cleaner.
+
+Usage:
+    python benchmark_cleaning.py                 # all reports, variants of the first 200
+    python benchmark_cleaning.py --limit 100 --variants 100
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+from report_cleaning import CLAUDE_PROFILE, GROK_PROFILE, ReportCleaner, clean_report
+from report_store import DATA_DIR
+
+
+# ============================================================================
+# ORIGINAL IMPLEMENTATIONS (reference output)
+# ============================================================================
+
+def legacy_clean_claude(content):
+    thinking_patterns = [
+        r"(?i)^.*?I'll conduct.*?(?=\n#|\n##|$)",
+        r"(?i)^.*?Let me (search|conduct|analyze|gather).*?(?=\n#|\n##|$)",
+        r"(?i)^.*?Now (I'll|let me|I will).*?(?=\n#|\n##|$)",
+        r"(?i)^.*?Based on (my|the) (research|search|analysis).*?(?=\n#|\n##|$)",
+        r"(?i)^.*?I have (gathered|collected|found).*?(?=\n#|\n##|$)",
+        r"(?i)^.*?After (searching|analyzing|reviewing).*?(?=\n#|\n##|$)",
+        r"(?i)^.*?First,? (I'll|let me).*?(?=\n#|\n##|$)",
+    ]
+    phrases = [
+        "i'll", "let me", "now i", "first,", "based on",
+        "after searching", "i have gathered", "i will"
+    ]
+    return _legacy_clean(content, thinking_patterns, phrases)
+
+
+def legacy_clean_grok(content):
+    thinking_patterns = [
+        r"(?i)^.*?I'll (conduct|search|analyze|gather|provide|create).*?(?=\n#|\n##|$)",
+        r"(?i)^.*?Let me (search|conduct|analyze|gather|compile|create).*?(?=\n#|\n##|$)",
+        r"(?i)^.*?Now (I'll|let me|I will).*?(?=\n#|\n##|$)",
+        r"(?i)^.*?Based on (my|the) (research|search|analysis|information).*?(?=\n#|\n##|$)",
+        r"(?i)^.*?I (have|will) (gathered|compiled|analyzed).*?(?=\n#|\n##|$)",
+        r"(?i)^.*?After (searching|analyzing|reviewing).*?(?=\n#|\n##|$)",
+        r"(?i)^.*?First,? (I'll|let me|I will).*?(?=\n#|\n##|$)",
+        r"(?i)^.*?Here's (a|the) (comprehensive|detailed).*?(?=\n#|\n##|$)",
+    ]
+    phrases = [
+        "i'll", "let me", "now i", "first,", "based on", "here's",
+        "after searching", "i have", "i will", "i've compiled"
+    ]
+    return _legacy_clean(content, thinking_patterns, phrases)
+
+
+def _legacy_clean(content, thinking_patterns, phrases):
+    for pattern in thinking_patterns:
+        content = re.sub(pattern, '', content, flags=re.DOTALL | re.MULTILINE)
+
+    lines = content.split('\n')
+    clean_lines = []
+    found_header = False
+
+    for line in lines:
+        if re.match(r'^#{1,6}\s+', line):
+            found_header = True
+            clean_lines.append(line)
+        elif found_header:
+            clean_lines.append(line)
+        elif not line.strip():
+            clean_lines.append(line)
+        elif any(phrase in line.lower() for phrase in phrases):
+            continue
+        else:
+            if len(line) > 50:
+                clean_lines.append(line)
+
+    return '\n'.join(clean_lines).strip()
+
+
+def legacy_enforce_title_format(content, ticker):
+    lines = content.split('\n')
+
+    first_header_idx = -1
+    for i, line in enumerate(lines):
+        if re.match(r'^#\s+', line):
+            first_header_idx = i
+            break
+
+    if first_header_idx == -1:
+        company_name = None
+        for line in lines:
+            if re.match(r'^##\s+', line):
+                match = re.search(r'##\s+([^-\(]+)', line)
+                if match:
+                    company_name = match.group(1).strip()
+                    break
+
+        if not company_name:
+            company_name = ticker
+
+        title = f"# {company_name} ({ticker}) - Comprehensive Analysis Report\n\n"
+        return title + content
+
+    current_title = lines[first_header_idx]
+
+    if f"({ticker})" in current_title and "Comprehensive Analysis Report" in current_title:
+        return content
+
+    match = re.search(r'#\s+([^-\(]+)', current_title)
+    if match:
+        company_name = match.group(1).strip()
+        company_name = re.sub(r'\s*(Inc\.?|Corp\.?|Corporation|Company|Ltd\.?).*$', '', company_name, flags=re.IGNORECASE)
+        company_name = re.sub(r'\s*\([A-Z]+\).*$', '', company_name)
+    else:
+        company_name = ticker
+
+    new_title = f"# {company_name} ({ticker}) - Comprehensive Analysis Report"
+    lines[first_header_idx] = new_title
+
+    return '\n'.join(lines)
+
+
+LEGACY = {
+    CLAUDE_PROFILE.name: legacy_clean_claude,
+    GROK_PROFILE.name: legacy_clean_grok,
+}
+
+
+# ============================================================================
+# INPUTS
+# ============================================================================
+
+PREAMBLE = """I'll conduct comprehensive research on {ticker} to provide a detailed analysis.
+
+Let me search for the latest financial data and recent developments.
+
+Now let me gather information about competitors.
+
+Here's the comprehensive report you asked for, compiled from public filings and news:
+
+"""
+
+
+def dirty_variants(content, ticker):
+    """The stored report plus the kinds of raw output the cleaner has to handle"""
+    lines = content.split('\n')
+    first_section = next((i for i, line in enumerate(lines) if line.startswith("## ")), 0)
+    body = '\n'.join(lines[first_section:])
+    middle = len(lines) // 2
+
+    return {
+        "stored": content,
+        "preamble": PREAMBLE.format(ticker=ticker) + content,
+        "untitled": PREAMBLE.format(ticker=ticker) + body,
+        "wrong_title": f"# {ticker} Corp. Stock Analysis\n\n" + body,
+        "mid_thinking": '\n'.join(lines[:middle] + ["After reviewing the filings, more detail:"] + lines[middle:]),
+        "crlf": content.replace('\n', '\r\n'),
+    }
+
+
+def load_reports(limit=None):
+    reports = []
+    for filepath in sorted(Path(DATA_DIR).glob("*.json")):
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"  Error loading {filepath.name}: {str(e)}")
+            continue
+        if data.get("content"):
+            reports.append((data.get("ticker", filepath.stem), data["content"]))
+        if limit and len(reports) >= limit:
+            break
+    return reports
+
+
+def stream_in_chunks(content, ticker, profile, rng):
+    cleaner = ReportCleaner(ticker, profile)
+    position = 0
+    while position < len(content):
+        size = rng.randint(1, 400)
+        cleaner.feed(content[position:position + size])
+        position += size
+    return cleaner.finish()
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Golden check and micro-benchmark for report_cleaning.py")
+    parser.add_argument("--limit", type=int, default=None, help="only use the first N reports")
+    parser.add_argument("--variants", type=int, default=200,
+                        help="also check dirty variants of the first N reports")
+    args = parser.parse_args()
+
+    reports = load_reports(args.limit)
+    if not reports:
+        print(f"ERROR: No reports found in {DATA_DIR}/")
+        exit(1)
+
+    cases = []
+    for i, (ticker, content) in enumerate(reports):
+        variants = dirty_variants(content, ticker) if i < args.variants else {"stored": content}
+        for variant, text in variants.items():
+            cases.append((ticker, variant, text))
+    total_kb = sum(len(content) for _, content in reports) / 1024
+
+    print("=" * 60)
+    print("QUICK TICK - CLEANING BENCHMARK")
+    print("=" * 60)
+    print(f"Reports: {len(reports)} ({total_kb:,.0f} KB), cases: {len(cases)} x 2 profiles")
+    print("The original functions are slow - expect this to take a while on the full data set")
+    print()
+
+    # Golden check, timing both implementations on the Claude rules as it goes
+    rng = random.Random(0)
+    mismatches = 0
+    timings = {"stored": [0.0, 0.0], "dirty": [0.0, 0.0]}
+    for profile in (CLAUDE_PROFILE, GROK_PROFILE):
+        legacy_clean = LEGACY[profile.name]
+        for ticker, variant, text in cases:
+            start = time.perf_counter()
+            expected = legacy_enforce_title_format(legacy_clean(text), ticker)
+            middle = time.perf_counter()
+            output = clean_report(text, ticker, profile)
+            end = time.perf_counter()
+
+            if profile is CLAUDE_PROFILE:
+                timing = timings["stored" if variant == "stored" else "dirty"]
+                timing[0] += middle - start
+                timing[1] += end - middle
+
+            streamed = stream_in_chunks(text, ticker, profile, rng)
+            for mode, result in (("whole", output), ("stream", streamed)):
+                if result != expected:
+                    mismatches += 1
+                    if mismatches <= 10:
+                        print(f"  ✗ {ticker} [{profile.name}/{variant}/{mode}] differs from the original output")
+
+    if mismatches:
+        print(f"✗ {mismatches} outputs differ from the original implementation")
+    else:
+        print(f"✓ All {len(cases) * 4:,} outputs identical to the original implementation")
+    print()
+
+    print(f"{'Input':<16} {'Original (s)':>14} {'Cleaner (s)':>14} {'Speedup':>10}")
+    print("-" * 58)
+    for label, (old, new) in (("stored reports", timings["stored"]), ("dirty variants", timings["dirty"])):
+        if new > 0:
+            print(f"{label:<16} {old:>14.3f} {new:>14.3f} {old / new:>9.1f}x")
+    print()
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Quick Tick Generation Benchmark
+
+Measures wall-clock time for a full daily bucket against the local mock
+API server, comparing the old serial loop with the concurrent engine in
+generate_company_data.py. Requests go through the same provider pool as in
+production (llm_providers.py), pointed at the mock server.
+
+Latency and the old fixed REQUEST_DELAY are scaled down so the benchmark runs
+in seconds; the speedup ratio is what carries over to real runs. The mock
+server sends rate-limit headers, so the concurrent runs are paced by the
+shared rate limiter exactly as in production. With --down anthropic every
+Claude call fails and the run exercises failover to the mock Grok endpoint.
+
+Requirements:
+- anthropic library (install: pip install anthropic)
+- daily_buckets.py and mock_api_server.py in the same directory
+
+Usage:
+    python benchmark_generation.py --day 1 --latency 1.0 --delay 0.25 --workers 4 8
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("ANTHROPIC_API_KEY", "mock-key")
+os.environ.setdefault("XAI_API_KEY", "mock-key")
+
+import generate_company_data as generator
+from daily_buckets import get_bucket
+from mock_api_server import start_mock_server
+
+
+def time_bucket(pool, tickers, workers):
+    """Run one bucket through run_bucket() and return (seconds, successes)"""
+    start = time.perf_counter()
+    successes = sum(1 for _, data in generator.run_bucket(pool, tickers, max_workers=workers) if data)
+    return time.perf_counter() - start, successes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bucket generation against a mock API")
+    parser.add_argument("--day", type=int, default=1, help="bucket to replay (1-91)")
+    parser.add_argument("--latency", type=float, default=1.0, help="simulated seconds per API call")
+    parser.add_argument("--delay", type=float, default=0.25, help="scaled old fixed REQUEST_DELAY in seconds")
+    parser.add_argument("--workers", type=int, nargs="+", default=[4, 8],
+                        help="concurrency ceilings to compare against serial")
+    parser.add_argument("--down", choices=["anthropic", "openai"], nargs="*", default=[],
+                        help="providers the mock server reports as overloaded")
+    args = parser.parse_args()
+
+    tickers = get_bucket(args.day)
+    server = start_mock_server(latency=args.latency, down=args.down)
+    os.environ["ANTHROPIC_BASE_URL"] = server.base_url
+    os.environ["XAI_BASE_URL"] = f"{server.base_url}/v1"
+    pool = generator.report_pool()
+
+    print("=" * 60)
+    print("QUICK TICK - GENERATION BENCHMARK")
+    print("=" * 60)
+    print(f"Bucket: day {args.day} ({len(tickers)} tickers)")
+    print(f"Mock latency: {args.latency}s per call, old fixed delay: {args.delay}s")
+    print()
+
+    # Old behaviour: one call at a time with a fixed sleep after each ticker
+    start = time.perf_counter()
+    serial_successes = 0
+    for i, ticker in enumerate(tickers, 1):
+        if generator.generate_company_data(pool, ticker):
+            serial_successes += 1
+        if i < len(tickers):
+            time.sleep(args.delay)
+    serial_time = time.perf_counter() - start
+
+    results = [("serial (old loop)", serial_time, serial_successes)]
+    for workers in args.workers:
+        elapsed, successes = time_bucket(pool, tickers, workers)
+        results.append((f"concurrent x{workers}", elapsed, successes))
+
+    server.shutdown()
+    if server.outage_count:
+        print(f"\nFailed over after {server.outage_count} overloaded responses")
+
+    print()
+    print("=" * 60)
+    print(f"{'Mode':<22}{'Seconds':>10}{'OK':>6}{'Speedup':>10}")
+    for name, elapsed, successes in results:
+        print(f"{name:<22}{elapsed:>10.2f}{successes:>6}{serial_time / elapsed:>9.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
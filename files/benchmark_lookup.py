@@ -0,0 +1,144 @@
+"""
+Quick Tick Lookup Benchmark
+
+Compares what a page view costs with the single company_lookup.json against
+the sharded index written by build_lookup_index.py:
+
+- company page: the whole lookup vs one lookup/shards/{n}.json
+- autocomplete: the whole lookup vs one lookup/prefix/{xx}.json
+- random ticker: the whole lookup vs one random shard
+
+Files are served from a local HTTP server that adds a round trip and caps
+bandwidth (default: a slow mobile connection), gzip-encoded as Cloudflare
+serves them, and each fetch is timed through to the parsed JSON.
+
+Usage:
+    python build_lookup_index.py
+    python benchmark_lookup.py --samples 20 --bandwidth 1600 --rtt 150
+"""
+
+import argparse
+import gzip
+import json
+import random
+import statistics
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from build_lookup_index import LOOKUP_DIR, LOOKUP_SHARDS, PREFIX_LENGTH, load_companies, normalize_key, shard_for
+from scheduler import LOOKUP_FILE
+
+
+CHUNK_SIZE = 4096
+
+
+def start_file_server(root, bandwidth_kbps, rtt_ms, compress):
+    """Serve files under root with a fixed round trip and a bandwidth cap"""
+    root = Path(root).resolve()
+    bytes_per_second = bandwidth_kbps * 1000 / 8
+
+    class ThrottledHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = (root / self.path.lstrip('/')).resolve()
+            if root not in path.parents or not path.is_file():
+                self.send_error(404)
+                return
+            body = path.read_bytes()
+            if compress:
+                body = gzip.compress(body, mtime=0)
+
+            time.sleep(rtt_ms / 1000)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if compress:
+                self.send_header("Content-Encoding", "gzip")
+            self.end_headers()
+            for start in range(0, len(body), CHUNK_SIZE):
+                chunk = body[start:start + CHUNK_SIZE]
+                self.wfile.write(chunk)
+                time.sleep(len(chunk) / bytes_per_second)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottledHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    return server
+
+
+def fetch_json(url):
+    """(parsed JSON, bytes on the wire, seconds) for one GET"""
+    start = time.perf_counter()
+    with urllib.request.urlopen(url) as response:
+        body = response.read()
+        encoding = response.headers.get("Content-Encoding")
+    transferred = len(body)
+    if encoding == "gzip":
+        body = gzip.decompress(body)
+    value = json.loads(body)
+    return value, transferred, time.perf_counter() - start
+
+
+def measure(base_url, paths):
+    """(mean bytes, mean milliseconds) over the given paths"""
+    sizes = []
+    timings = []
+    for path in paths:
+        _, transferred, seconds = fetch_json(f"{base_url}/{path}")
+        sizes.append(transferred)
+        timings.append(seconds * 1000)
+    return statistics.mean(sizes), statistics.mean(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the full company lookup with the sharded index")
+    parser.add_argument("--samples", type=int, default=10, help="lookups to average per scenario")
+    parser.add_argument("--bandwidth", type=float, default=1600, help="simulated bandwidth in kbit/s")
+    parser.add_argument("--rtt", type=float, default=150, help="simulated round trip in milliseconds")
+    parser.add_argument("--no-gzip", action="store_true", help="serve files uncompressed")
+    args = parser.parse_args()
+
+    if not (Path(LOOKUP_DIR) / "index.json").exists():
+        print(f"ERROR: {LOOKUP_DIR}/ not found - run build_lookup_index.py first")
+        exit(1)
+
+    companies = load_companies()
+    rng = random.Random(0)
+    tickers = rng.sample(sorted(companies), args.samples)
+    prefixes = [normalize_key(companies[ticker].get("name") or ticker)[:PREFIX_LENGTH] for ticker in tickers]
+
+    server = start_file_server(".", args.bandwidth, args.rtt, not args.no_gzip)
+
+    scenarios = [
+        ("Full lookup (any page)", [LOOKUP_FILE] * args.samples),
+        ("Company page shard", [f"{LOOKUP_DIR}/shards/{shard_for(ticker)}.json" for ticker in tickers]),
+        ("Autocomplete prefix", [f"{LOOKUP_DIR}/prefix/{prefix}.json" for prefix in prefixes]),
+        ("Random ticker shard", [f"{LOOKUP_DIR}/shards/{rng.randrange(LOOKUP_SHARDS)}.json"
+                                 for _ in range(args.samples)]),
+    ]
+
+    print("=" * 60)
+    print("QUICK TICK - LOOKUP BENCHMARK")
+    print("=" * 60)
+    print(f"{args.samples} samples, {args.bandwidth:,.0f} kbit/s, {args.rtt:.0f} ms RTT, "
+          f"{'uncompressed' if args.no_gzip else 'gzip'}")
+    print()
+    print(f"{'Scenario':<26}{'Bytes':>12}{'ms':>10}{'vs full':>10}")
+    print("-" * 58)
+
+    full_ms = None
+    for label, paths in scenarios:
+        size, ms = measure(server.base_url, paths)
+        full_ms = full_ms or ms
+        print(f"{label:<26}{size:>12,.0f}{ms:>10,.0f}{ms / full_ms:>9.1%}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Quick Tick Lookup Index Builder
+
+Splits company_lookup.json into small files the website can fetch one at a
+time, instead of downloading the whole map on every page view:
+
+- lookup/shards/{n}.json - the lookup records, spread over LOOKUP_SHARDS
+  files by a hash of the ticker (FNV-1a, mirrored in index.html and
+  company.html), so one company's sector and exchange cost one small file
+- lookup/prefix/{xx}.json - autocomplete entries [key, ticker, name] sorted by
+  key, where the key is the normalized ticker or company name and xx is its
+  first PREFIX_LENGTH characters (shorter keys get a file of their own)
+- lookup/index.json - shard count, prefix length and counts, for other tools
+
+Only files whose content changed are rewritten, and files for keys that no
+longer exist are removed, so a rebuild with an unchanged lookup is a no-op.
+
+Usage:
+    python build_lookup_index.py
+    python build_lookup_index.py --stats   # also print file size statistics
+"""
+
+import argparse
+import gzip
+import json
+import re
+import statistics
+from pathlib import Path
+
+from report_store import write_text_atomic
+from scheduler import LOOKUP_FILE, NON_COMPANY_ROWS, TICKER_PATTERN
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+LOOKUP_DIR = "lookup"
+LOOKUP_SHARDS = 128  # Must match LOOKUP_SHARDS in index.html and company.html
+PREFIX_LENGTH = 2
+
+# Dropped from the end of company names before indexing ("Apple Inc" -> "apple")
+NAME_SUFFIXES = {
+    "inc", "incorporated", "corp", "corporation", "co", "company", "ltd", "limited",
+    "plc", "llc", "lp", "sa", "nv", "ag", "holdings", "group", "the", "class", "a", "b", "c",
+}
+NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]+')
+
+
+# ============================================================================
+# INDEX
+# ============================================================================
+
+def shard_for(ticker, shards=LOOKUP_SHARDS):
+    """Shard number for a ticker (32-bit FNV-1a, same as lookupShard() in the pages)"""
+    value = 0x811c9dc5
+    for byte in ticker.encode('utf-8'):
+        value ^= byte
+        value = (value * 0x01000193) & 0xffffffff
+    return value % shards
+
+
+def normalize_key(text):
+    """Lowercase letters and digits only (queries are normalized the same way)"""
+    return NON_ALPHANUMERIC.sub('', text.lower())
+
+
+def normalize_name(name):
+    """Company name as an autocomplete key, without trailing corporate suffixes"""
+    words = NON_ALPHANUMERIC.sub(' ', name.lower()).split()
+    while len(words) > 1 and words[-1] in NAME_SUFFIXES:
+        words.pop()
+    return ''.join(words)
+
+
+def load_companies(path=LOOKUP_FILE):
+    """Lookup records keyed by ticker, without the non-company rows"""
+    with open(path, 'r', encoding='utf-8') as f:
+        lookup = json.load(f)
+    return {
+        ticker: record for ticker, record in lookup.items()
+        if TICKER_PATTERN.fullmatch(ticker) and ticker not in NON_COMPANY_ROWS
+    }
+
+
+def build_files(companies):
+    """
+    Every index file's path (relative to LOOKUP_DIR) and JSON text.
+
+    Returns:
+        dict: relative path -> file text
+    """
+    shards = {}
+    for ticker, record in companies.items():
+        shards.setdefault(shard_for(ticker), {})[ticker] = record
+
+    prefixes = {}
+    for ticker, record in companies.items():
+        name = record.get("name") or ""
+        keys = {normalize_key(ticker)}
+        if name:
+            keys.add(normalize_name(name))
+        for key in keys:
+            if key:
+                prefixes.setdefault(key[:PREFIX_LENGTH], []).append([key, ticker, name])
+
+    files = {}
+    for number, records in shards.items():
+        files[f"shards/{number}.json"] = _dump(dict(sorted(records.items())))
+    for prefix, entries in prefixes.items():
+        files[f"prefix/{prefix}.json"] = _dump(sorted(entries))
+    files["index.json"] = _dump({
+        "shards": LOOKUP_SHARDS,
+        "hash": "fnv1a32",
+        "prefix_length": PREFIX_LENGTH,
+        "companies": len(companies),
+        "prefix_files": len(prefixes),
+    })
+    return files
+
+
+def _dump(value):
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+def write_index(files, lookup_dir=LOOKUP_DIR):
+    """
+    Write changed files and remove stale ones.
+
+    Returns:
+        tuple: (files written, files removed)
+    """
+    root = Path(lookup_dir)
+    written = 0
+    for relative, text in files.items():
+        path = root / relative
+        if path.exists() and path.read_text(encoding='utf-8') == text:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_text_atomic(path, text)
+        written += 1
+
+    removed = 0
+    for path in list(root.glob("shards/*.json")) + list(root.glob("prefix/*.json")):
+        if path.relative_to(root).as_posix() not in files:
+            path.unlink()
+            removed += 1
+    return written, removed
+
+
+def size_stats(files, folder):
+    """(count, mean bytes, max bytes, mean gzip bytes) for one folder of index files"""
+    texts = [text.encode('utf-8') for relative, text in files.items() if relative.startswith(folder)]
+    gzipped = [len(gzip.compress(text, mtime=0)) for text in texts]
+    return len(texts), statistics.mean(map(len, texts)), max(map(len, texts)), statistics.mean(gzipped)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the sharded company lookup and autocomplete index")
+    parser.add_argument("--stats", action="store_true", help="print file size statistics")
+    args = parser.parse_args()
+
+    companies = load_companies()
+    files = build_files(companies)
+    written, removed = write_index(files)
+
+    print(f"✓ {len(companies)} companies -> {LOOKUP_DIR}/ ({len(files)} files, "
+          f"{written} written, {removed} removed)")
+
+    if args.stats:
+        full = Path(LOOKUP_FILE).read_bytes()
+        print()
+        print(f"{'Files':<22}{'Count':>7}{'Mean B':>10}{'Max B':>10}{'Mean gz B':>11}")
+        print("-" * 60)
+        print(f"{LOOKUP_FILE:<22}{1:>7}{len(full):>10,}{len(full):>10,}"
+              f"{len(gzip.compress(full, mtime=0)):>11,}")
+        for folder in ("shards/", "prefix/"):
+            count, mean, largest, mean_gz = size_stats(files, folder)
+            print(f"{LOOKUP_DIR + '/' + folder:<22}{count:>7}{mean:>10,.0f}{largest:>10,}{mean_gz:>11,.0f}")
+
+
+if __name__ == "__main__":
+    main()
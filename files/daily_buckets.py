@@ -2,8 +2,12 @@
 QuickTick AI - Daily Update Buckets
 
 91 daily buckets for quarterly rolling updates.
-Total: 3486 companies
-Evenly distributed: 38-39 tickers per day
+Total: 3461 companies
+Balanced by rebalance_buckets.py on predicted cost and generation time:
+38-39 tickers, $14.65-$15.10 and ~15-16 min per day
+
+The generators now plan each day with scheduler.py (staleness, failures and
+a daily budget). These lists remain the fallback for days without a plan.
 
 Usage:
     from daily_buckets import get_bucket
@@ -11,738 +15,747 @@ Usage:
 """
 
 DAILY_BUCKETS = [
-    # Day 1 - 39 tickers
+    # Day 1 - 38 tickers, ~$14.96, ~11.02M tokens, ~15 min
     [
-        "AVGO", "META", "BRK.B", "LLY", "JPM", "JNJ", "XOM", "WMT", "NFLX", "COST",
-        "ABBV", "HD", "PG", "BAC", "GE", "UNH", "CVX", "IBM", "WFC", "CSCO",
-        "CAT", "MRK", "KO", "PM", "GS", "RTX", "ABT", "TMO", "MCD", "PEP",
-        "LRCX", "LIN", "DIS", "AMGN", "UBER", "QCOM", "NEE", "AXP", "INTU",
+        "HLT", "ROP", "WEC", "OTIS", "THC", "SW", "USFD", "WTFC", "ESTC", "BIO",
+        "THG", "SPR", "MGEE", "EEFT", "GT", "SEI", "BLBD", "BLFS", "ECVT", "NIQ",
+        "NRDS", "RCKT", "WOW", "PBFS", "FSFG", "SBFG", "HOFT", "APT", "PLCE", "RFIL",
+        "GLSI", "RNTX", "EP", "NDLS", "BRFH", "PASG", "HIT", "BTOC",
     ],
 
-    # Day 2 - 39 tickers
+    # Day 2 - 39 tickers, ~$15.02, ~10.79M tokens, ~15 min
     [
-        "APH", "TJX", "C", "INTC", "BKNG", "GILD", "VZ", "SPGI", "KLAC", "TXN",
-        "BSX", "APP", "PFE", "DHR", "BLK", "BA", "COF", "WELL", "UNP", "LOW",
-        "ADBE", "ETN", "ADI", "SYK", "HON", "DE", "PLD", "CEG", "CB", "VRTX",
-        "COP", "MCK", "PH", "BX", "LMT", "CVS", "CME", "SO", "BMY",
+        "CIEN", "GIS", "K", "PFG", "BG", "ZBRA", "UDR", "BSY", "CHRD", "AMTM",
+        "VVV", "INSP", "ASO", "UPWK", "RXO", "FBNC", "SYBT", "LTC", "PDM", "RWT",
+        "CMPX", "NABL", "DFH", "MCBS", "AOSL", "DHIL", "TBRG", "VENU", "WEST", "GETY",
+        "INFU", "CXDO", "AISP", "AIRJ", "OTLK", "FLWS", "PBHC", "USIO", "BHM",
     ],
 
-    # Day 3 - 39 tickers
+    # Day 3 - 38 tickers, ~$14.85, ~10.82M tokens, ~15 min
     [
-        "NEM", "MO", "SBUX", "CMCSA", "DUK", "TMUS", "TT", "MMM", "MMC", "ICE",
-        "WM", "ORLY", "CDNS", "HCA", "GD", "HWM", "NOC", "KKR", "CRH", "BK",
-        "SNPS", "REGN", "SHW", "MRVL", "TDG", "USB", "ELV", "JCI", "EMR", "PNC",
-        "MCO", "MDLZ", "WMB", "CI", "EQIX", "AON", "UPS", "ECL", "GM",
+        "LMT", "ICE", "NOC", "CBRE", "CMG", "UTHR", "ALAB", "HII", "SATS", "AHR",
+        "KNX", "POR", "CNX", "ABCB", "BOX", "APGE", "CHH", "LEVI", "SKWD", "OS",
+        "NWL", "HLF", "AMPH", "SMBK", "HCKT", "EOLS", "STRT", "CVLG", "OMI", "MRBK",
+        "ACR", "ULH", "BRCC", "SPRU", "QRHC", "FTHM", "CCEL", "BCG",
     ],
 
-    # Day 4 - 39 tickers
+    # Day 4 - 38 tickers, ~$14.91, ~10.93M tokens, ~15 min
     [
-        "PWR", "ITW", "CMI", "COR", "DASH", "HLT", "TEL", "AEP", "MAR", "AZO",
-        "TRV", "CSX", "NSC", "RCL", "GLW", "CL", "ADSK", "CTAS", "AJG", "SRE",
-        "FCX", "MSI", "VST", "IDXX", "PYPL", "TFC", "AFL", "MPC", "EOG", "STX",
-        "COIN", "FDX", "APD", "SPG", "ROST", "WDC", "WBD", "ALL", "BDX",
+        "NEM", "MSTR", "DVN", "CG", "AES", "BF.B", "BEN", "VLY", "ENS", "CAVA",
+        "WULF", "EOSE", "WMG", "KYMR", "AGYS", "COLD", "RSI", "WOR", "ABR", "NN",
+        "AMWD", "HSTM", "NVEC", "FRPH", "RCKY", "TCX", "OPRT", "PAL", "CMT", "FNWD",
+        "HURC", "PEW", "PROP", "CNTY", "BOF", "LVLU", "SNYR", "SNES",
     ],
 
-    # Day 5 - 39 tickers
+    # Day 5 - 38 tickers, ~$14.65, ~10.62M tokens, ~16 min
     [
-        "PCAR", "PSX", "VLO", "DLR", "SLB", "D", "APO", "O", "URI", "LHX",
-        "KMI", "MNST", "ZTS", "EW", "CAH", "EA", "BKR", "CVNA", "XEL", "CBRE",
-        "ROP", "EXC", "NDAQ", "WDAY", "FAST", "CMG", "CTVA", "OKE", "AME", "ABNB",
-        "CARR", "RSG", "A", "ETR", "PSA", "MET", "TTWO", "GWW", "AMP",
+        "AMZN", "AMD", "WTW", "FSLR", "FE", "TROW", "BJ", "EVR", "AR", "FAF",
+        "SITM", "TGTX", "MARA", "MATX", "NMIH", "DRS", "FDP", "OUST", "OSBC", "MCB",
+        "IBRX", "EGBN", "AVO", "HELE", "GMRE", "RYAM", "MVBF", "VNDA", "INGN", "KG",
+        "STKS", "AMWL", "CURV", "CUE", "SCOR", "SWAG", "FGNX", "RGS",
     ],
 
-    # Day 6 - 39 tickers
+    # Day 6 - 38 tickers, ~$14.91, ~10.86M tokens, ~15 min
     [
-        "DHI", "YUM", "MPWR", "AIG", "DAL", "MSCI", "TGT", "FICO", "DELL", "AXON",
-        "CCI", "VMC", "HIG", "PRU", "EQT", "EBAY", "TRGP", "MLM", "RMD", "IQV",
-        "XYZ", "VTR", "PAYX", "ED", "KMB", "WEC", "KDP", "WAB", "OTIS", "NUE",
-        "GEHC", "PCG", "FIX", "FIS", "XYL", "KEYS", "CPRT", "FISV", "UAL",
+        "INTC", "CMI", "LNG", "HPQ", "PKG", "GWRE", "RGA", "MKTX", "OGS", "REZI",
+        "LAUR", "SKYW", "AIR", "NATL", "MLYS", "NTCT", "PD", "MFA", "ZBIO", "GLUE",
+        "BCAX", "VIR", "ADAM", "HTBK", "VTS", "TCMD", "SSTK", "OVLY", "EB", "QNCX",
+        "TYGO", "SWKH", "RRGB", "CDLX", "CIX", "KOSS", "SMXT", "COCH",
     ],
 
-    # Day 7 - 39 tickers
+    # Day 7 - 38 tickers, ~$14.91, ~10.75M tokens, ~15 min
     [
-        "ACGL", "KVUE", "NRG", "ARES", "GRMN", "IR", "VRSK", "WTW", "OXY", "SNDK",
-        "MTD", "EXPE", "MTB", "HUM", "ADM", "CSGP", "TSCO", "MCHP", "SYF", "FITB",
-        "FANG", "AEE", "HPE", "ATO", "EXR", "RJF", "VICI", "HSY", "FSLR", "EXE",
-        "EME", "IBKR", "CCL", "CBOE", "BIIB", "BR", "AWK", "EFX", "CINF",
+        "PGR", "JCI", "BIIB", "VRSN", "NVR", "EHC", "PRI", "CORT", "BRKR", "ADT",
+        "CLSK", "PRMB", "LGND", "BNL", "CAKE", "VICR", "CRI", "IDT", "ROOT", "EPC",
+        "FIGS", "MOFG", "GES", "NX", "RDVT", "LXRX", "LPRO", "XPOF", "ASIC", "SNFCA",
+        "INTT", "PDEX", "CLST", "TCRX", "GCTS", "CPSH", "SYPR", "MKTW",
     ],
 
-    # Day 8 - 39 tickers
+    # Day 8 - 38 tickers, ~$14.92, ~10.94M tokens, ~15 min
     [
-        "STE", "FE", "CNP", "PPL", "AVB", "ODFL", "HBAN", "IRM", "DOV", "GIS",
-        "PHM", "ES", "DXCM", "TEAM", "LDOS", "ULTA", "DTE", "DG", "WAT", "NTRS",
-        "VLTO", "LEN", "DVN", "STLD", "TDY", "PODD", "HPQ", "HUBB", "OMC", "TPR",
-        "RF", "EIX", "CMS", "BRO", "TROW", "EQR", "LH", "PPG", "WRB",
+        "UNH", "CVS", "AJG", "APO", "ADM", "TPR", "RS", "REG", "ELF", "EPR",
+        "VRNS", "BL", "APLE", "CBZ", "CURB", "GOLF", "PAYO", "PRA", "ARRY", "COUR",
+        "SAFE", "ABUS", "PACB", "SXC", "MNRO", "PKE", "MEC", "SCVL", "FENC", "JELD",
+        "FDBC", "AMBQ", "ESOA", "SMTI", "NTWK", "BDSX", "LSF", "LGL.WS",
     ],
 
-    # Day 9 - 39 tickers
+    # Day 9 - 38 tickers, ~$14.85, ~10.81M tokens, ~15 min
     [
-        "WSM", "CFG", "DLTR", "LYV", "NTAP", "JBL", "VRSN", "KHC", "DGX", "LVS",
-        "PTC", "DRI", "SBAC", "IP", "EL", "NI", "CHD", "ON", "NVR", "TYL",
-        "HAL", "KEY", "LULU", "WST", "EXPD", "CPAY", "CTRA", "ROL", "TRMB", "CNC",
-        "ZBH", "STZ", "CDW", "PFG", "SW", "PKG", "LUV", "GPC", "FTV",
+        "CRM", "ADI", "CTVA", "INSM", "HEI", "TSN", "PINS", "AYI", "CFR", "BROS",
+        "VOYA", "SITE", "OLED", "RYN", "PRVA", "EPAC", "NSA", "SGRY", "GRC", "STAA",
+        "NAVI", "MBWM", "AVAH", "CBL", "ARHS", "SGHT", "RPAY", "MFIN", "ASUR", "ARCT",
+        "TBI", "HBB", "CHGG", "TACT", "SVCO", "JOB", "HFBL", "NINE",
     ],
 
-    # Day 10 - 39 tickers
+    # Day 10 - 38 tickers, ~$14.85, ~10.95M tokens, ~15 min
     [
-        "LNT", "IFF", "EVRG", "CHTR", "CHRW", "L", "SNA", "GDDY", "INCY", "PNR",
-        "SMCI", "MKC", "ESS", "Q", "APTV", "TPL", "DOW", "IT", "HOLX", "DD",
-        "TSN", "INVH", "J", "WY", "MAA", "LII", "COO", "ALB", "BBY", "TXT",
-        "GEN", "ALLE", "KIM", "FFIV", "GPN", "MAS", "BALL", "RL", "JBHT",
+        "APP", "DE", "SYY", "CCL", "AVB", "W", "RNA", "APA", "COKE", "CHWY",
+        "FCN", "BRBR", "CVBF", "CHEF", "CTRI", "IPAR", "AXGN", "AHCO", "NNE", "HBNC",
+        "CSV", "CABO", "TCBX", "NPCE", "DOMO", "MBI", "MCFT", "BLFY", "CZFS", "CABA",
+        "BLZE", "STRS", "ATOM", "CPBI", "UFI", "AP", "QTTB", "OSTX",
     ],
 
-    # Day 11 - 39 tickers
+    # Day 11 - 38 tickers, ~$14.90, ~10.92M tokens, ~15 min
     [
-        "BG", "AVY", "CLX", "EG", "IEX", "FOXA", "DECK", "UHS", "REG", "ZBRA",
-        "AKAM", "DPZ", "CF", "TKO", "JKHY", "DOC", "LYB", "SOLV", "VTRS", "HII",
-        "RVTY", "HST", "UDR", "NDSN", "BLDR", "AIZ", "BXP", "CPT", "SWK", "HAS",
-        "NWSA", "IVZ", "PNW", "SJM", "FDS", "GL", "DAY", "ALGN", "TECH",
+        "PM", "UPS", "PRU", "HSY", "EIX", "VTRS", "MDGL", "BWA", "MOH", "OPEN",
+        "TCBI", "FTDR", "GRAL", "FUL", "CNK", "OLMA", "PK", "ACHC", "DGII", "GBX",
+        "MCRI", "CSTL", "THRM", "ALH", "UPBD", "IRMD", "CYH", "MAX", "MOV", "FRMI",
+        "STEX", "ELA", "HURA", "CPSS", "CVGI", "MYPS", "TPCS", "FARM",
     ],
 
-    # Day 12 - 39 tickers
+    # Day 12 - 38 tickers, ~$15.09, ~11.13M tokens, ~15 min
     [
-        "WYNN", "AES", "EPAM", "SWKS", "BAX", "ARE", "MRNA", "APA", "GNRC", "CRL",
-        "CAG", "FRT", "PAYC", "BF.B", "NCLH", "POOL", "LW", "MOH", "MTCH", "MOS",
-        "TAP", "HSIC", "FOX", "AOS", "ERIE", "BEN", "HRL", "MGM", "CPB", "PSKY",
-        "DVA", "NWS", "T", "SCHW", "MDT", "AMT", "VRT", "ALNY", "F",
+        "ETN", "VRTX", "NKE", "MNST", "YUM", "Q", "REXR", "DINO", "ONB", "LUMN",
+        "BPOP", "BCPC", "CROX", "SKT", "ICUI", "ACAD", "CXT", "CLDX", "BELFB", "STOK",
+        "STBA", "SILA", "TRS", "CTS", "OBK", "HAFC", "GLIBK", "NP", "FRGE", "BSVN",
+        "UIS", "JYNT", "AWRE", "AMPG", "RVPH", "ANEB", "BRID", "SQFTW",
     ],
 
-    # Day 13 - 39 tickers
+    # Day 13 - 38 tickers, ~$14.76, ~10.69M tokens, ~15 min
     [
-        "FERG", "WCN", "INSM", "LNG", "PEG", "KR", "FLUT", "SYY", "VEEV", "SOFI",
-        "STT", "NTRA", "CIEN", "LPLA", "BRK.A", "PSTG", "RDDT", "CRDO", "MKL", "HEI.A",
-        "K", "UTHR", "CW", "CASY", "ZM", "FWONK", "RKLB", "EXAS", "ILMN", "THC",
-        "FTI", "HUBS", "SGI", "RBA", "RKT", "GWRE", "WWD", "AFRM", "TLN",
+        "BAC", "MRK", "EMR", "F", "DAL", "TSCO", "AA", "GMED", "AIT", "ARE",
+        "JHG", "MC", "NPO", "CVCO", "WK", "PLXS", "FIBK", "AAOI", "USPH", "MTUS",
+        "DC", "BETR", "GRNT", "TH", "FVCB", "LNKB", "MRAM", "SEVN", "WHG", "APYX",
+        "EHTH", "TZOO", "MGX", "LGL", "LSTA", "IRIX", "CXAI", "CLRB",
     ],
 
-    # Day 14 - 39 tickers
+    # Day 14 - 38 tickers, ~$14.79, ~10.75M tokens, ~15 min
     [
-        "TWLO", "SSNC", "FTAI", "USFD", "NVT", "FCNCA", "TRU", "FN", "BWXT", "SUI",
-        "BURL", "XPO", "DKNG", "JLL", "FNF", "RIVN", "PFGC", "NBIX", "CRS", "PINS",
-        "APG", "WPC", "EWBC", "RS", "NLY", "ITT", "RBC", "EQH", "DOCU", "ATI",
-        "CG", "RPM", "TOL", "ACM", "GGG", "CACI", "CSL", "OKTA", "OHI",
+        "TEL", "WDC", "D", "ROL", "TLN", "STRL", "LSTR", "ALGM", "AMBA", "NOG",
+        "MSGE", "AI", "BKE", "YELP", "BHE", "SCL", "WMK", "RCAT", "IRWD", "KREF",
+        "GRND", "CLNE", "CVGW", "KRUS", "PCB", "OPRX", "UMAC", "SENS", "KFS", "MNTN",
+        "STHO", "LGCY", "CHYM", "VRCA", "SLNG", "TVGN", "MPLT", "LGVN",
     ],
 
-    # Day 15 - 39 tickers
+    # Day 15 - 38 tickers, ~$14.88, ~10.84M tokens, ~15 min
     [
-        "U", "MTZ", "RGLD", "DT", "MEDP", "LECO", "DKS", "RVMD", "WCC", "NXT",
-        "KTOS", "Z", "GH", "BLD", "TW", "ROKU", "IONS", "RGA", "BBIO", "DTM",
-        "UNM", "RNR", "NTNX", "WSO", "QXO", "WMS", "SF", "BJ", "EVR", "ENTG",
-        "EHC", "GLPI", "TXRH", "ELAN", "MLI", "LAMR", "ASTS", "FHN", "SNX",
+        "TSLA", "FISV", "IR", "RBA", "LECO", "IONS", "IVZ", "LAD", "OMF", "PB",
+        "AUR", "NUVL", "GPK", "IAC", "MD", "HLIO", "FCF", "ARI", "PAY", "EYPT",
+        "TFSL", "CNXN", "GOLD", "CLBK", "RRBI", "PINE", "NMRA", "CTGO", "IKT", "MASS",
+        "CRMT", "LWAY", "ONL", "KLTR", "AREN", "OM", "APLT", "UBCP",
     ],
 
-    # Day 16 - 39 tickers
+    # Day 16 - 38 tickers, ~$14.77, ~10.70M tokens, ~15 min
     [
-        "EXEL", "ALLY", "CCK", "AYI", "W", "MTSI", "WTRG", "ELS", "CLH", "AGNC",
-        "PEN", "AA", "BMRN", "HL", "ENSG", "AR", "MDGL", "OKLO", "MANH", "SCI",
-        "CDE", "MKSI", "OVV", "AVAV", "DCI", "CMA", "RMBS", "IOT", "BAH", "PR",
-        "GMED", "ORI", "JAZZ", "SPXC", "AMH", "STRL", "DY", "NYT", "REXR",
+        "ABT", "AMAT", "SPGI", "XYZ", "NUE", "DKS", "MANH", "OVV", "LKQ", "AGCO",
+        "PATH", "MZTI", "VSCO", "BKD", "LINE", "NMRK", "SM", "AVDL", "FIVN", "PLAB",
+        "MAZE", "SRCE", "ELVN", "CCNE", "GDEN", "NRIM", "ANGO", "ANGI", "USAU", "WTI",
+        "FOA", "FBYD", "FNKO", "OFLX", "MCHX", "SER", "YHGJ", "NOVS",
     ],
 
-    # Day 17 - 39 tickers
+    # Day 17 - 38 tickers, ~$14.85, ~10.94M tokens, ~15 min
     [
-        "WBS", "RNA", "AFG", "AIT", "ARMK", "SATS", "RRX", "EGP", "HLI", "OC",
-        "FYBR", "PLNT", "OWL", "FLS", "BWA", "AAL", "IDCC", "OGE", "GTLS", "CNM",
-        "RGEN", "TTEK", "HQY", "FIVE", "GME", "SSB", "CR", "RRC", "SEIC", "WTFC",
-        "AHR", "WAL", "KNSL", "MOD", "CUBE", "ROIV", "UGI", "DINO", "HALO",
+        "KLAC", "ITW", "ALNY", "RBLX", "KR", "XYL", "TDY", "ESS", "DECK", "M",
+        "ARW", "IBOC", "DORM", "RRR", "PFS", "FRME", "IOSP", "LION", "XPRO", "SDGR",
+        "HNGE", "TYRA", "FISI", "FFIC", "RGR", "LXU", "PGC", "WRLD", "TALK", "ABAT",
+        "EGHT", "GIFI", "LFMD", "SKIN", "NNBR", "FKWL", "CVM", "XLO",
     ],
 
-    # Day 18 - 39 tickers
+    # Day 18 - 38 tickers, ~$14.99, ~11.02M tokens, ~15 min
     [
-        "PRI", "CRBG", "JEF", "PCOR", "COLB", "ADC", "SNAP", "CTRE", "CART", "SFM",
-        "OSK", "ATR", "AWI", "LAD", "COKE", "RBRK", "VMI", "CYTK", "BRX", "AVTR",
-        "AEIS", "LYFT", "QRVO", "SANM", "ZION", "LNC", "NNN", "ONB", "G", "JOBY",
-        "CNH", "LKQ", "ZWS", "UMBF", "AXS", "FR", "WTS", "SOLS", "OLLI",
+        "BX", "FERG", "EXC", "BR", "CMS", "INCY", "DKNG", "LYB", "EMN", "HXL",
+        "GATX", "MORN", "QTWO", "ASB", "VRDN", "IVT", "AORT", "SPNT", "CCB", "PGEN",
+        "PKST", "SSP", "ALTO", "NKSH", "ALCO", "SMID", "ASYS", "NXDT", "STRW", "HGBL",
+        "RBKB", "PNRG", "BZFD", "DARE", "NVNO", "FAT", "NXPL", "CKX",
     ],
 
-    # Day 19 - 39 tickers
+    # Day 19 - 38 tickers, ~$14.83, ~10.81M tokens, ~15 min
     [
-        "CFR", "SAIA", "LUMN", "TPG", "NFG", "CLF", "ALSN", "WING", "MASI", "HIMS",
-        "STAG", "OMF", "JBTM", "BPOP", "CADE", "EXP", "RYTM", "AMG", "DUOL", "HEI",
-        "CMC", "AN", "EMN", "IDA", "CORT", "PNFP", "KNX", "BROS", "ONTO", "SSD",
-        "ARWR", "FLR", "INGR", "CHDN", "TTC", "CHWY", "FND", "PTCT", "VFC",
+        "VLO", "URI", "MDB", "DRI", "ZM", "BURL", "ALGN", "IBP", "SWX", "SXT",
+        "AKRO", "ENPH", "FOLD", "SHOO", "REVG", "OGN", "RAMP", "TCBK", "WWW", "SEB",
+        "GO", "RIGL", "AMPL", "AIV", "BRSP", "MYE", "NXDR", "LCTX", "FVR", "ARKO",
+        "ACIC", "MXCT", "AARD", "GRCE", "SIEB", "ACRV", "KPLT", "BFRG",
     ],
 
-    # Day 20 - 39 tickers
+    # Day 20 - 38 tickers, ~$15.03, ~11.10M tokens, ~15 min
     [
-        "JXN", "CBSH", "TTMI", "MAT", "VOYA", "AGCO", "R", "MUSA", "FSS", "GAP",
-        "H", "MTG", "ORA", "AXTA", "PCTY", "MOG.A", "PRIM", "EAT", "TRNO", "ESAB",
-        "PCVX", "AAON", "AXSM", "HR", "SMTC", "CHE", "STWD", "AL", "FAF", "VNO",
-        "CWAN", "SNV", "LFUS", "KEX", "SEE", "DOCS", "RYAN", "EPRT", "IBP",
+        "COP", "KKR", "EQT", "TXT", "CSL", "PR", "WAL", "CMC", "BFAM", "UFPI",
+        "PSN", "BC", "APAM", "PAG", "SONO", "NWN", "WRBY", "MXL", "PRO", "CLOV",
+        "FG", "UDMY", "BCAL", "NAGE", "NEWT", "CTNM", "GPRO", "LAW", "MNSB", "CFBK",
+        "TSQ", "IRBT", "SIDU", "TCBS", "RLYB", "PPSI", "CISO", "BTCSP",
     ],
 
-    # Day 21 - 39 tickers
+    # Day 21 - 38 tickers, ~$14.96, ~10.96M tokens, ~15 min
     [
-        "SITM", "PB", "FBIN", "VNOM", "CRUS", "TXNM", "BSY", "MHK", "EXLS", "NEU",
-        "RITM", "HXL", "MIR", "AM", "IRTC", "CWST", "BIO", "CIFR", "SITE", "FCFS",
-        "MSA", "THG", "ESI", "KD", "FNB", "AUR", "BOOT", "TMHC", "ESNT", "BFAM",
-        "LIF", "GTES", "SLM", "MKTX", "COGT", "GXO", "KMX", "GKOS", "M",
+        "TXN", "SBAC", "TWLO", "ALB", "OHI", "FOXA", "RNR", "CLF", "SNV", "MGY",
+        "BHF", "LOAR", "PBF", "FRSH", "AMRX", "FLO", "KN", "STRA", "LEG", "ENVX",
+        "BBNX", "UCTT", "HRTG", "VTYX", "NRC", "CNDT", "MYFW", "BVFL", "KRO", "IMMX",
+        "VTSI", "TISI", "CBUS", "CTSO", "SABS", "IROQ", "BEAT", "ARKR",
     ],
 
-    # Day 22 - 39 tickers
+    # Day 22 - 38 tickers, ~$14.88, ~10.94M tokens, ~15 min
     [
-        "NOV", "RDNT", "LEA", "RHP", "LAZ", "ULS", "FROG", "GATX", "KRYS", "ACI",
-        "PIPR", "HRB", "PTGX", "WH", "POR", "RAL", "ARW", "NXST", "ESE", "NUVL",
-        "DAR", "LBRDK", "CVLT", "COMP", "UEC", "JHG", "DBX", "MORN", "MIDD", "GTLB",
-        "RLI", "CHRD", "VLY", "WFRD", "ENS", "OLED", "BKH", "SWX", "THO",
+        "MA", "EW", "AMP", "FLUT", "VEEV", "ES", "CDE", "GL", "VMI", "CNH",
+        "MSA", "NOV", "PIPR", "HOMB", "CALM", "BOH", "EXTR", "ALG", "ZYME", "ADEA",
+        "COTY", "JBGS", "PRG", "XERS", "CXM", "MEG", "CIVB", "ILPT", "TRDA", "SNDA",
+        "USNA", "CHRS", "DTIL", "FGEN", "LEE", "NIXX", "JRSH", "FCUV",
     ],
 
-    # Day 23 - 39 tickers
+    # Day 23 - 38 tickers, ~$14.83, ~10.80M tokens, ~15 min
     [
-        "CDTX", "VNT", "KBR", "FCN", "UBSI", "BMI", "ACA", "GBCI", "CNX", "MTN",
-        "GPI", "LMND", "BRKR", "ROAD", "UFPI", "LPX", "MMSI", "AGX", "TKR", "ETSY",
-        "KRG", "QLYS", "WEX", "KRC", "OPCH", "BCPC", "TFX", "OGS", "GNTX", "HOMB",
-        "WTM", "MTH", "SR", "OZK", "ALK", "ABCB", "ALKS", "HWC", "HLNE",
+        "BRK.B", "ABBV", "AMGN", "LHX", "EBAY", "UAL", "APG", "OLLI", "HRL", "HR",
+        "WFRD", "PSKY", "HUBG", "BWIN", "MBX", "BFC", "RLJ", "JAMF", "ORIC", "BBSI",
+        "BLND", "MPB", "SKYT", "ZVRA", "BSRR", "PRME", "BIOA", "RMBI", "ACNT", "NPWR",
+        "NVCT", "DHX", "CYPH", "PRLD", "ORGN", "OESX", "TELO", "DYAI",
     ],
 
-    # Day 24 - 39 tickers
+    # Day 24 - 39 tickers, ~$15.10, ~10.95M tokens, ~15 min
     [
-        "MMS", "ACIW", "CAVA", "AUB", "NJR", "OPEN", "RDN", "POST", "GPK", "SIGI",
-        "TGTX", "MC", "MTDR", "QS", "TMDX", "APPF", "PRAX", "MRP", "NPO", "FOUR",
-        "CVCO", "GVA", "ECG", "BILL", "BYD", "SBRA", "ST", "CORZ", "URBN", "SKY",
-        "CZR", "WK", "UHAL.B", "CE", "CSW", "ABG", "WULF", "CCC", "PSN",
+        "PCAR", "EME", "TTD", "NWSA", "IDCC", "SSB", "NCLH", "DOCS", "TREX", "KBH",
+        "GEO", "CUBI", "GNL", "IRDM", "TDOC", "CSR", "RVLV", "RZLT", "ORRF", "OPY",
+        "HYMC", "AIOT", "OSPN", "NGVC", "BOC", "GSIT", "INSG", "EVI", "MBOT", "MLP",
+        "AMTX", "HAIN", "VHC", "TKNO", "IMA", "LITS", "SCWO", "TLF", "AIRE",
     ],
 
-    # Day 25 - 39 tickers
+    # Day 25 - 38 tickers, ~$14.85, ~10.79M tokens, ~15 min
     [
-        "LSTR", "ITRI", "TTAN", "PI", "AMKR", "BDC", "ADT", "HRI", "PECO", "ANF",
-        "BCO", "LOPE", "REZI", "RUN", "AX", "MAC", "CROX", "VSAT", "MDU", "ADMA",
-        "MUR", "BC", "SPR", "OSIS", "CUZ", "WHR", "LEU", "QTWO", "CRNX", "ACHR",
-        "HASI", "STEP", "HUT", "NWE", "RIG", "FORM", "KNF", "TNL", "LEN.B",
+        "COST", "GS", "CEG", "HWM", "MCHP", "SMCI", "MTCH", "PTCT", "FNB", "NXST",
+        "PI", "MSM", "HAE", "WSC", "CBT", "SARO", "DIOD", "SCS", "TRIP", "KALU",
+        "VYX", "SNCY", "CBRL", "TRTX", "LXEO", "XOMA", "TSSI", "FLXS", "TNYA", "CBFV",
+        "HYPR", "DXLG", "STUB", "DOMH", "PDSB", "JUNS", "KITT", "ADTI",
     ],
 
-    # Day 26 - 39 tickers
+    # Day 26 - 38 tickers, ~$14.81, ~10.86M tokens, ~15 min
     [
-        "WAY", "AMTM", "SON", "ATMU", "SXT", "MARA", "AKRO", "COMM", "ASB", "KTB",
-        "BTSG", "HCC", "TCBI", "DLB", "ELF", "AROC", "NOVT", "AGO", "MGY", "FLG",
-        "PVH", "BOX", "SAIC", "EBC", "CLSK", "ACLX", "SNEX", "IRT", "LNTH", "VIAV",
-        "MSGS", "SLAB", "EPR", "VVV", "AVT", "MSM", "FTDR", "VSEC", "VKTX",
+        "NFLX", "SPG", "FTNT", "ATO", "COHR", "BE", "RBC", "CCK", "HSIC", "MMS",
+        "CNO", "CDP", "YETI", "CALX", "CPRI", "DAVE", "OII", "ATRC", "DBD", "PBI",
+        "TRVI", "XHR", "DXPE", "ALIT", "NPKI", "HTZ", "ABL", "SMLR", "CZWI", "INBK",
+        "TLSI", "GENC", "EPSN", "CBNA", "CULP", "SLND", "RENT", "RAVE",
     ],
 
-    # Day 27 - 39 tickers
+    # Day 27 - 38 tickers, ~$14.84, ~10.80M tokens, ~15 min
     [
-        "SIG", "SIRI", "ALE", "HAE", "WMG", "CNR", "PRM", "CELC", "LAUR", "SKYW",
-        "BRBR", "NE", "LLYVK", "PJT", "KYMR", "PLXS", "CWK", "PFSI", "FFIN", "PRMB",
-        "OSCR", "MWA", "MRCY", "CNO", "LGND", "FHI", "TREX", "BHF", "IESC", "ZG",
-        "VCYT", "KBH", "TDS", "IBOC", "UCB", "LTH", "BBWI", "INSP", "EXPO",
+        "JNJ", "UBER", "FIX", "TEAM", "STZ", "DT", "ROKU", "NJR", "BILL", "OSIS",
+        "HURN", "CIVI", "ACLS", "DNOW", "GSHD", "ATRO", "TALO", "IIPR", "FIGR", "VRTS",
+        "TSHA", "ESPR", "CGEM", "MVST", "ADTN", "EE", "BFLY", "SPFI", "EBF", "OOMA",
+        "FBLA", "FUNC", "FOSL", "MNTK", "SEER", "FTCI", "CLPR", "FORA",
     ],
 
-    # Day 28 - 39 tickers
+    # Day 28 - 38 tickers, ~$15.05, ~10.99M tokens, ~15 min
     [
-        "DORM", "SKT", "SRRK", "INDB", "FELE", "NHI", "ENPH", "PII", "GNW", "VRNS",
-        "GPOR", "SFBS", "ICUI", "SHC", "NVST", "CDP", "MHO", "PATK", "OTTR", "RYN",
-        "KFY", "APGE", "CALM", "WSC", "HAYW", "CRC", "SLGN", "GRAL", "GHC", "SLG",
-        "RNST", "YETI", "VCTR", "AVA", "KVYO", "SHAK", "OUT", "CBT", "ARQT",
+        "CAT", "LRCX", "ELV", "AON", "BLD", "PEN", "OWL", "HALO", "BOOT", "RAL",
+        "RLI", "OPCH", "ACIW", "SON", "OSCR", "CWT", "LRN", "DX", "ANDE", "KNSA",
+        "INVA", "PMT", "CRAI", "EIG", "ASPI", "AVNS", "PLPC", "MTW", "KELYA", "SLQT",
+        "AREC", "FC", "OBIO", "ANIX", "SND", "ADVM", "PHUN", "GIFT",
     ],
 
-    # Day 29 - 38 tickers
+    # Day 29 - 38 tickers, ~$14.97, ~11.11M tokens, ~15 min
     [
-        "MYRG", "VRRM", "FULT", "MATX", "KAI", "ZETA", "CPK", "BKU", "BRC", "CALX",
-        "VAL", "PSMT", "ASO", "ALGM", "MZTI", "YOU", "TENB", "AEO", "BGC", "PLMR",
-        "ATGE", "BL", "CATY", "RARE", "BNL", "BXMT", "FBP", "ACAD", "UUUU", "SPSC",
-        "TVTX", "GFF", "FUL", "BTU", "ENVA", "WGS", "VSCO", "TGNA",
+        "BA", "MSI", "BDX", "CAH", "LNT", "FRT", "PCOR", "TEM", "GTLB", "BYD",
+        "AX", "CRC", "ALHC", "RELY", "SYRE", "VECO", "CRGY", "OMCL", "WINA", "AMSF",
+        "BBW", "ACEL", "ALMS", "CRVS", "KRNY", "FRST", "ISTR", "CHMG", "MDV", "NREF",
+        "LUCD", "CAI", "ALGS", "IMDX", "XTNT", "KSCP", "RDI", "AMOD",
     ],
 
-    # Day 30 - 38 tickers
+    # Day 30 - 38 tickers, ~$14.90, ~10.99M tokens, ~15 min
     [
-        "POWL", "MIRM", "WSFS", "AAP", "AGYS", "COLD", "CGON", "FHB", "AIR", "GSAT",
-        "TPC", "HGV", "FOLD", "SHOO", "SARO", "DOCN", "TARS", "MGEE", "HIW", "CBU",
-        "AZZ", "BFH", "HOG", "RRR", "PCH", "IDYA", "SXI", "NMIH", "WSBC", "DAN",
-        "WHD", "PBH", "LOAR", "EEFT", "VIRT", "TEX", "CPRI", "RUSHA",
+        "ROK", "FIS", "HUM", "FITB", "DG", "IP", "IT", "GEN", "EXP", "BKH",
+        "BMI", "GPOR", "FULT", "SRPT", "HUN", "HRMY", "CLMT", "BCRX", "VERX", "NSP",
+        "ANAB", "LENZ", "SERV", "SMC", "PEPG", "HNST", "AVIR", "ELMD", "PEBK", "PAYS",
+        "BDTX", "CDXS", "LAKE", "DFDV", "ICCC", "MXC", "VEEA", "IPW",
     ],
 
-    # Day 31 - 38 tickers
+    # Day 31 - 38 tickers, ~$14.76, ~10.74M tokens, ~15 min
     [
-        "BCC", "CNK", "HURN", "CARG", "ADPT", "AWR", "WU", "TPH", "VC", "VRDN",
-        "AVNT", "TBBK", "FRPT", "DYN", "PBF", "APAM", "SBCF", "FIBK", "BLKB", "LBRT",
-        "FRSH", "CWEN", "CXT", "LXP", "NSIT", "DRS", "NATL", "CPRX", "CIVI", "KGS",
-        "KAR", "PRVA", "CWT", "PL", "AKR", "ABM", "SFNC", "HHH",
+        "AXP", "AZO", "RSG", "MLM", "FANG", "PPL", "IRM", "CACI", "JXN", "COMP",
+        "UBSI", "GLXY", "IDYA", "WU", "CCS", "LGIH", "JBI", "GOSS", "TDAY", "CRMD",
+        "ATXS", "IMXI", "FLY", "PYXS", "MPAA", "HUMA", "FLD", "VIRC", "RILY", "ALMU",
+        "GLIBR", "ASPS", "PXLW", "LVO", "AMS", "NRXS", "AGAE", "GLBZ",
     ],
 
-    # Day 32 - 38 tickers
+    # Day 32 - 38 tickers, ~$14.88, ~10.77M tokens, ~15 min
     [
-        "WDFC", "ALHC", "PTON", "PAG", "LRN", "RHI", "BOH", "INSW", "LCII", "KSS",
-        "MPW", "ACLS", "MCY", "NCNO", "UNF", "TDC", "CVBF", "ONDS", "MGRC", "BKD",
-        "ITGR", "APLE", "GTM", "CRWV", "ATEC", "CBZ", "DAVE", "FCPT", "SYNA", "HP",
-        "CON", "BOKF", "WAFD", "REVG", "UPWK", "INTA", "LINE", "JOE",
+        "JPM", "NSC", "ROST", "ALL", "WSM", "PEGA", "TTAN", "ADMA", "SNEX", "PLMR",
+        "SXI", "PL", "ALRM", "BANF", "SMMT", "ICFI", "CNMD", "USLM", "CIM", "UNIT",
+        "BW", "IDR", "GTN", "REPX", "TARA", "USCB", "JMSB", "ARDT", "PDYN", "TNXP",
+        "GPMT", "SRBK", "OLPX", "NRDY", "RANI", "HOWL", "SCYX", "RLMT",
     ],
 
-    # Day 33 - 38 tickers
+    # Day 33 - 38 tickers, ~$14.72, ~10.59M tokens, ~15 min
     [
-        "DNOW", "ALRM", "HWKN", "XMTR", "OII", "NMRK", "SMG", "SUPN", "OLN", "IRON",
-        "MTRN", "KMPR", "UE", "FBK", "ASH", "SLNO", "PLUS", "PFS", "RH", "DXC",
-        "GT", "IAC", "EWTX", "PLUG", "DNLI", "BANC", "CHH", "TOWN", "BEAM", "COCO",
-        "RNG", "APLS", "TDW", "XRAY", "CURB", "FFBC", "HI", "ATKR",
+        "RTX", "BMY", "HOOD", "CI", "DHI", "PEG", "MSCI", "AAL", "GME", "CR",
+        "SOLS", "QBTS", "DBX", "BCO", "CRCL", "CELC", "WSFS", "INTA", "DVAX", "PACS",
+        "FA", "KURA", "ALNT", "CTKB", "HTFL", "BAND", "PLSE", "SDHC", "DBI", "MCRB",
+        "ATOS", "PRPL", "PSQH", "TEAD", "MDAI", "AIRT", "TOMZ", "FUSB",
     ],
 
-    # Day 34 - 38 tickers
+    # Day 34 - 38 tickers, ~$14.77, ~10.71M tokens, ~15 min
     [
-        "PRK", "CHEF", "HUBG", "RELY", "NUVB", "SPHR", "KRMN", "EXTR", "DK", "PARR",
-        "ADUS", "GOLF", "TERN", "IVT", "FWONA", "AMRX", "SM", "CSGS", "RXO", "EYE",
-        "PENN", "TRN", "CAR", "STC", "UNFI", "PTEN", "BBT", "WLK", "MLYS", "CAKE",
-        "SONO", "BRZE", "GEO", "AORT", "MGNI", "TRMK", "KMT", "LQDA",
+        "SBUX", "SHW", "DLTR", "EXAS", "SUI", "DOCU", "TECH", "MRNA", "AWI", "CYTK",
+        "AEIS", "AMG", "MTDR", "SHC", "CPK", "VC", "VVX", "PHR", "EVER", "OMER",
+        "HOV", "WASH", "IMRX", "ENTA", "PSTL", "VOYG", "CIA", "OPFI", "ASPN", "TSBK",
+        "GRWG", "SRTS", "ATRA", "FSEA", "NOTV", "MHH", "NERV", "MSS",
     ],
 
-    # Day 35 - 38 tickers
+    # Day 35 - 38 tickers, ~$14.92, ~10.88M tokens, ~15 min
     [
-        "MD", "WD", "CUBI", "CACC", "OI", "GRBK", "NOG", "LEVI", "VICR", "CRVL",
-        "AVPT", "RCUS", "SPNT", "BANR", "TXG", "FLO", "PGNY", "NBTB", "EPAC", "HE",
-        "DIOD", "BANF", "OCUL", "SYRE", "SEI", "NSA", "VCEL", "FRME", "NWN", "FBNC",
-        "PHIN", "OLMA", "OGN", "SMMT", "SRPT", "BUSE", "AVDL", "NNI",
+        "GEHC", "PSTG", "KEY", "CLX", "AKAM", "WTRG", "LFUS", "PTGX", "TFX", "POST",
+        "UHAL", "CRNX", "FLG", "SIG", "WHD", "ITGR", "SMR", "VCEL", "CHCO", "HCSG",
+        "SPB", "QCRH", "NKTR", "GERN", "ALRS", "SWBI", "SNWV", "ALLO", "LFCR", "BFIN",
+        "ARQ", "UNCY", "BARK", "LNSR", "OPAD", "IPM", "NYC", "HYZN",
     ],
 
-    # Day 36 - 38 tickers
+    # Day 36 - 38 tickers, ~$14.87, ~10.74M tokens, ~15 min
     [
-        "WRBY", "HCI", "LC", "ARR", "CRK", "DEI", "BWIN", "DDS", "CNXC", "CC",
-        "NGVT", "KWR", "EFSC", "MSGE", "CTRI", "RXRX", "SYBT", "MQ", "POWI", "ASGN",
-        "HMN", "QDEL", "DRH", "EVTC", "IOSP", "DX", "IPGP", "CLDX", "NTCT", "MTX",
-        "PK", "PRGO", "TWST", "CXW", "LION", "SDRL", "PPC", "HLIO",
+        "C", "ADP", "DDOG", "ETR", "NRG", "ODFL", "CFG", "PTC", "GKOS", "KRYS",
+        "SAIC", "HWKN", "CACC", "NNI", "CXW", "FMC", "TNET", "VAC", "CECO", "TILE",
+        "RLAY", "OCFC", "THS", "FIZZ", "OFIX", "LYTS", "BXC", "DNUT", "LAND", "MG",
+        "CBIO", "NGNE", "UTMD", "GYRE", "REI", "PETS", "DXR", "BNAI",
     ],
 
-    # Day 37 - 38 tickers
+    # Day 37 - 38 tickers, ~$14.79, ~10.78M tokens, ~15 min
     [
-        "HNI", "RAMP", "FMC", "SMPL", "PRGS", "SKWD", "CNS", "SHO", "BELFB", "OFG",
-        "GEF", "DJT", "DBRG", "GNL", "NWBI", "KN", "VECO", "VERA", "NTST", "CCS",
-        "HUN", "IE", "HRMY", "BKE", "YELP", "ENOV", "GSHD", "HLMN", "TNET", "CASH",
-        "SNDX", "VAC", "ATRC", "ATRO", "NHC", "LMAT", "AGIO", "SCS",
+        "ISRG", "GLW", "CARR", "PCG", "EXPD", "FFIV", "CART", "TTC", "TTMI", "AM",
+        "ROAD", "CSW", "SHAK", "KAR", "CON", "SBH", "PCT", "HOUS", "PEB", "PENG",
+        "CTBI", "HFWA", "INN", "HIPO", "CCBG", "LWLG", "GDYN", "ARTNA", "ATEX", "MEI",
+        "FTK", "ZVIA", "GUTS", "ALOT", "AIFF", "PXED", "ACFN", "DRCT",
     ],
 
-    # Day 38 - 38 tickers
+    # Day 38 - 38 tickers, ~$14.93, ~10.81M tokens, ~15 min
     [
-        "VSH", "CHCO", "IMVT", "CRGY", "STRA", "LTC", "ACMR", "PAYO", "LCID", "PRCT",
-        "AMR", "ANDE", "RSI", "UFPT", "KNSA", "ALG", "BLBD", "WOR", "OS", "SEM",
-        "PRDO", "SLVM", "TPB", "GTY", "LZ", "LZB", "STOK", "FLYW", "FCF", "AAOI",
-        "OMCL", "LASR", "CLMT", "SBH", "CENTA", "STBA", "ANIP", "CECO",
+        "MSFT", "ANET", "OXY", "CSGP", "NTAP", "DAY", "RYTM", "ONTO", "LMND", "TNL",
+        "SPSC", "FHB", "ABM", "FBK", "LQDA", "AVPT", "RXRX", "SMPL", "PRKS", "HLX",
+        "UVE", "BZH", "FMNB", "URG", "MNPR", "NUTX", "NGS", "LXFR", "CBNK", "MBCN",
+        "CAPR", "KULR", "RCEL", "SLSN", "NRXP", "HBIO", "UONEK", "USEG",
     ],
 
-    # Day 39 - 38 tickers
+    # Day 39 - 38 tickers, ~$14.84, ~10.88M tokens, ~15 min
     [
-        "BATRK", "NEO", "MNKD", "CENX", "TRIP", "ELME", "DBD", "SAM", "FSLY", "AGM",
-        "TILE", "ROG", "NWL", "MODG", "BHE", "PBI", "HTH", "ACHC", "BCRX", "LLYVA",
-        "KNTK", "NIC", "IRDM", "KALU", "ABR", "CWEN.A", "HTO", "ROCK", "DGII", "DV",
-        "IMNM", "WT", "JJSF", "WERN", "ARLO", "XPRO", "ICFI", "DNTH",
+        "MMM", "GD", "VRT", "EXE", "FWONK", "RVMD", "BAX", "LW", "LYFT", "AOS",
+        "CRUS", "MIR", "GPI", "URBN", "ACHR", "KSS", "HCI", "NBHC", "WEN", "IOVA",
+        "TREE", "CCO", "CTO", "ABSI", "HBCP", "DCTH", "HLLY", "RNGR", "FHTX", "AGEN",
+        "RPT", "KEQU", "GNSS", "MPX", "KZR", "VANI", "TOON", "SKLZ",
     ],
 
-    # Day 40 - 38 tickers
+    # Day 40 - 38 tickers, ~$14.87, ~10.81M tokens, ~15 min
     [
-        "PCT", "LKFN", "STEL", "FIVN", "AMLX", "IPAR", "ARI", "CCB", "PAY", "TALO",
-        "COLL", "TNDM", "NBHC", "AIN", "AZTA", "WLDN", "ZYME", "MBC", "PAR", "UPB",
-        "SHLS", "ARCB", "WLY", "IIPR", "FDP", "VERX", "FUN", "NSSC", "HCSG", "SPB",
-        "VVX", "NVCR", "TRVI", "TIC", "NVRI", "DVAX", "NRIX", "MAN",
+        "KO", "AFL", "DGX", "GPC", "DOC", "OKLO", "SFM", "QS", "LNTH", "MSGS",
+        "RUSHA", "CPRX", "LCII", "PTEN", "CRVL", "TXG", "MBC", "LADR", "MSEX", "NTSK",
+        "TMP", "VSTS", "WSR", "PX", "CYRX", "LIND", "IBTA", "BKTI", "HRTX", "AOMR",
+        "RAIL", "COSO", "SKIL", "RFL", "TUSK", "DAIO", "PODC", "TAIT",
     ],
 
-    # Day 41 - 38 tickers
+    # Day 41 - 38 tickers, ~$14.93, ~10.84M tokens, ~15 min
     [
-        "TNC", "HOUS", "CNMD", "PEB", "ZD", "TDOC", "COLM", "GABC", "XHR", "EFC",
-        "REAL", "SGRY", "ALKT", "JANX", "JBLU", "ARDX", "VYX", "GBX", "LEG", "SILA",
-        "PLAB", "HROW", "PZZA", "WINA", "QCRH", "REYN", "INVA", "RLAY", "NEOG", "DCO",
-        "PACS", "TCBK", "HOPE", "WEN", "FLNC", "ADEA", "ACVA", "AMC",
+        "AVGO", "PLD", "EQIX", "HPE", "ACM", "LAMR", "EGP", "CAG", "INGR", "ACI",
+        "VCTR", "DAN", "WAFD", "KWR", "HTO", "AMPX", "LOB", "SCSC", "UAMY", "SG",
+        "REPL", "CEVA", "GOGO", "CRNC", "TIPT", "MLAB", "CLPT", "SLDB", "LOCO", "PLBC",
+        "QSI", "TASK", "TWIN", "PLRX", "DCGO", "OCC", "DTI", "JFB",
     ],
 
-    # Day 42 - 38 tickers
+    # Day 42 - 38 tickers, ~$14.72, ~10.68M tokens, ~15 min
     [
-        "LADR", "DFIN", "TRS", "NKTR", "LNN", "FIGR", "UVV", "AXGN", "WWW", "CTS",
-        "HLF", "ENR", "PRLB", "PRA", "MCRI", "PGRE", "MBX", "TFIN", "XNCR", "BBNX",
-        "DCOM", "AAMI", "WKC", "MXL", "USLM", "CNOB", "CDRE", "WABC", "ALGT", "BF.A",
-        "ATEN", "NSP", "PFBC", "CMPR", "BFC", "DXPE", "SVRA", "TNGX",
+        "META", "CVX", "WFC", "NET", "STX", "MTD", "RPM", "WCC", "IOT", "RHP",
+        "OUT", "PSMT", "TOWN", "NUVB", "BBT", "NWBI", "CASH", "IMVT", "DNTH", "AZTA",
+        "XNCR", "ASTH", "DAKT", "EMBC", "SCHL", "ACHV", "EDIT", "ALTG", "CSPI", "EML",
+        "SGMO", "ULBI", "CATO", "PAMT", "CLNN", "NXTC", "KLXE", "LIVE",
     ],
 
-    # Day 43 - 38 tickers
+    # Day 43 - 38 tickers, ~$14.66, ~10.59M tokens, ~16 min
     [
-        "BLFS", "HSII", "COTY", "PHR", "UMH", "JBGS", "FTRE", "ARRY", "THR", "WS",
-        "LGN", "ECPG", "ACT", "TRUP", "ALEX", "UTI", "CSR", "EYPT", "NEXT", "USPH",
-        "SEB", "UWMC", "IMKTA", "VITL", "CERT", "PMT", "CRI", "SION", "CRAI", "ASAN",
-        "PDM", "LOB", "PRG", "UCTT", "FA", "NVAX", "OBK", "RLJ",
+        "TMUS", "HCA", "EQR", "LULU", "NVT", "FN", "RGLD", "NTNX", "ROIV", "RUN",
+        "POWL", "DOCN", "VIRT", "DYN", "JOE", "DBRG", "MAN", "UFCS", "BWFG", "BPRN",
+        "REFI", "CADL", "RMAX", "CARL", "SRFM", "CTM", "LFVN", "PMVP", "IPWR", "SKYE",
+        "SPAI", "MAIA", "CREX", "RVP", "BRN", "RBOT", "SYBX", "ERNA",
     ],
 
-    # Day 44 - 38 tickers
+    # Day 44 - 38 tickers, ~$14.70, ~10.64M tokens, ~15 min
     [
-        "AMRC", "VRE", "SAFT", "FWRG", "SDGR", "COHU", "GIII", "EZPW", "MLKN", "PWP",
-        "KURA", "TWO", "XERS", "FUBO", "PD", "SEZL", "DHC", "CSTL", "CVI", "HLIT",
-        "OCFC", "ASTH", "VRTS", "TSHA", "GO", "NN", "JAMF", "XPEL", "SAIL", "LGIH",
-        "THS", "IAS", "PCRX", "PENG", "KW", "GRC", "ORKA", "WTTR",
+        "PANW", "MMC", "SRE", "FTAI", "SNA", "EWBC", "SNX", "ENSG", "GXO", "SIGI",
+        "WAY", "TARS", "HP", "EFSC", "VERA", "TNC", "HSII", "RPD", "UTL", "GEVO",
+        "BKV", "GIC", "WTBA", "SVC", "AVTX", "ISSC", "PLBY", "ANVS", "RXT", "UPLD",
+        "BSBK", "INUV", "GWH", "WOLF", "GBIO", "CSAI", "TZUP", "HYFM",
     ],
 
-    # Day 45 - 38 tickers
+    # Day 45 - 38 tickers, ~$14.69, ~10.58M tokens, ~15 min
     [
-        "ASTE", "INVX", "MFA", "ORC", "PEBO", "EXPI", "IDT", "MAZE", "PRO", "ECVT",
-        "ORIC", "OSBC", "THRM", "ALIT", "PRKS", "CIM", "AHCO", "AMPH", "EIG", "INBX",
-        "SCL", "RVLV", "NTLA", "RPD", "WGO", "SRCE", "ELVN", "LUNR", "ALH", "ESRT",
-        "NPKI", "PHAT", "PRCH", "PVLA", "GBTG", "CLOV", "SNDR", "DEA",
+        "MPC", "O", "KMB", "MTB", "VLTO", "PODD", "J", "SOLV", "RMBS", "ETSY",
+        "BDC", "VIAV", "CNR", "BTU", "LC", "CNXC", "PRDO", "CENX", "GIII", "PNTG",
+        "SLDE", "LTBR", "SWIM", "FRBA", "FMAO", "RR", "LDI", "VABK", "INR", "LOVE",
+        "LCNB", "GEMI", "RGP", "EBMT", "AEYE", "ATNM", "AHT", "BNKK",
     ],
 
-    # Day 46 - 38 tickers
+    # Day 46 - 38 tickers, ~$14.88, ~10.85M tokens, ~15 min
     [
-        "TTI", "ESPR", "MSEX", "HLX", "STAA", "SAH", "REX", "VTOL", "CDNA", "UNIT",
-        "AAT", "DLX", "COUR", "UVSP", "WMK", "AVBP", "CCOI", "CTBI", "BV", "CXM",
-        "UTL", "ZBIO", "ROOT", "UPBD", "RAPP", "SMA", "BETA", "NTSK", "ARVN", "PDFS",
-        "IART", "BBSI", "GLUE", "SEPN", "MEG", "PNTG", "RIGL", "FBRT",
+        "TT", "LDOS", "NI", "GDDY", "U", "DCI", "MASI", "PNFP", "CIFR", "ULS",
+        "LBRDK", "MAC", "PATK", "ADPT", "INSW", "RH", "OCUL", "CENTA", "ARLO", "WKC",
+        "TRUP", "BHRB", "NBN", "LQDT", "CMCO", "ETON", "OLP", "BNC", "ASLE", "TRAK",
+        "SKYH", "EVC", "TGEN", "COYA", "RCMT", "ZDGE", "BIVI", "INLX",
     ],
 
-    # Day 47 - 38 tickers
+    # Day 47 - 38 tickers, ~$14.92, ~10.83M tokens, ~15 min
     [
-        "YEXT", "IAUX", "TMP", "UVE", "PAHC", "RAPT", "DRVN", "AMPL", "SBSI", "ANAB",
-        "FMBH", "BHRB", "HAFC", "HFWA", "EPC", "FIGS", "SMP", "GLDD", "HBNC", "JBI",
-        "SCSC", "IOVA", "ODP", "BJRI", "VSTM", "NAVI", "TFSL", "PUMP", "ALNT", "FIZZ",
-        "SIBN", "DAKT", "AD", "CMP", "KOD", "AMWD", "CNNE", "AIV",
+        "WELL", "ZTS", "KEYS", "SOFI", "TRMB", "LUV", "PLNT", "ALSN", "FCFS", "KD",
+        "VKTX", "NE", "CWK", "BGC", "HIW", "UNF", "ONDS", "CRK", "CC", "NHC",
+        "BV", "AMTB", "GDOT", "RES", "RC", "OCGN", "LPTH", "IMMR", "BHR", "BRT",
+        "OABI", "INNV", "SSBI", "OPAL", "GAIA", "SELF", "KPTI", "MOBX",
     ],
 
-    # Day 48 - 38 tickers
+    # Day 48 - 38 tickers, ~$14.92, ~10.88M tokens, ~15 min
     [
-        "PRSU", "GLIBK", "PLYM", "BCAX", "TRST", "IRMD", "LENZ", "BY", "TBPH", "LFST",
-        "NBBK", "QNST", "ERII", "CPF", "MDXG", "LBRDA", "RHLD", "HPP", "MCB", "SLDP",
-        "RZLT", "SAFE", "AMTB", "EMBC", "CFFN", "SNCY", "ESQ", "EVER", "ERAS", "LMB",
-        "METC", "AMSF", "TDUP", "DAWN", "NTGR", "CCNE", "RWT", "BRSP",
+        "FAST", "ZBH", "FCNCA", "HOLX", "AVY", "LSCC", "GTLS", "HQY", "MAT", "AL",
+        "S", "MMSI", "HLNE", "HHH", "WDFC", "PLUG", "GRBK", "UFPT", "STEL", "SION",
+        "SNDR", "SAH", "ESQ", "LYEL", "FSBW", "KIDS", "SRTA", "AII", "LTRX", "VOR",
+        "NAUT", "OVID", "BYND", "PZG", "FBIO", "BYFC", "BAFN", "OMCC",
     ],
 
-    # Day 49 - 38 tickers
+    # Day 49 - 38 tickers, ~$14.80, ~10.73M tokens, ~15 min
     [
-        "MBWM", "VSTS", "MIAX", "GOSS", "GERN", "MATW", "MMI", "VIR", "EQBK", "AXL",
-        "JBSS", "PLOW", "BLND", "APOG", "TDAY", "SANA", "BFST", "UA", "CMPX", "NIQ",
-        "FWRD", "VG", "NBR", "RCAT", "CARS", "AVAH", "CNXN", "IBRX", "SEMR", "UAA",
-        "BZH", "ABUS", "HRTG", "BBW", "IBCP", "MBIN", "MYGN", "ADAM",
+        "ORLY", "USB", "STT", "CPAY", "RKT", "GLPI", "SNAP", "AXTA", "ANF", "IRT",
+        "HGV", "BLKB", "TRMK", "FLYW", "NEOG", "DFIN", "UTI", "NEXT", "IMKTA", "UVSP",
+        "AVBP", "EBS", "FDMT", "ULCC", "MAMA", "RDW", "ZIP", "PCYO", "KINS", "SAVA",
+        "ACU", "RVSB", "MIND", "ARTV", "REFR", "BDL", "GENK", "ARAV",
     ],
 
-    # Day 50 - 38 tickers
+    # Day 50 - 38 tickers, ~$14.86, ~10.94M tokens, ~15 min
     [
-        "MYE", "UTZ", "KE", "RUSHB", "HNGE", "CTLP", "PACB", "ORRF", "GDOT", "TYRA",
-        "CRMD", "CAC", "TR", "KALV", "WSR", "FG", "UFCS", "AQST", "MATV", "CWH",
-        "CBRL", "CBL", "HTZ", "CTMX", "VTYX", "GPRE", "AESI", "AMN", "CGEM", "HTBK",
-        "AEHR", "DJCO", "MOFG", "NRDS", "FULC", "ADTN", "EE", "RYI",
+        "ACN", "ECL", "WAB", "TER", "AEE", "TPL", "ATI", "DTM", "PNW", "FYBR",
+        "ESAB", "NEU", "ESNT", "MTN", "MUR", "MWA", "VCYT", "QDEL", "FWRG", "XPEL",
+        "AXL", "CTLP", "SMBC", "CLB", "BHB", "GCO", "DDD", "TOI", "CRCT", "JRVR",
+        "VTGN", "ISBA", "BTCS", "CLYM", "TRT", "FEAM", "FLYX", "CJMB",
     ],
 
-    # Day 51 - 38 tickers
+    # Day 51 - 38 tickers, ~$14.91, ~10.86M tokens, ~15 min
     [
-        "UAMY", "OMER", "OPY", "GES", "RBCAA", "HYMC", "ANNX", "TREE", "THFF", "NX",
-        "MPB", "SG", "NXRT", "CTKB", "HNRG", "ACEL", "CMPO", "TRTX", "VTS", "RGNX",
-        "HTB", "SABR", "MTUS", "PRAA", "RUM", "HSTM", "INDI", "BW", "OFIX", "GHM",
-        "PX", "PSNL", "BOW", "FLGT", "SENEA", "ALMS", "GSBC", "NAVN",
+        "SYK", "MRVL", "APD", "SCI", "DY", "OSK", "ATR", "RGTI", "MOS", "CDTX",
+        "QLYS", "MHO", "ARQT", "LXP", "MQ", "HNI", "UPB", "EFC", "LNN", "SANA",
+        "SEMR", "HGTY", "MAGN", "EVH", "CLW", "MCHB", "VERI", "CIO", "HDSN", "PACK",
+        "FFAI", "ALTI", "ONEW", "LARK", "FLL", "NTIP", "LOCL", "SIF",
     ],
 
-    # Day 52 - 38 tickers
+    # Day 52 - 38 tickers, ~$14.69, ~10.64M tokens, ~15 min
     [
-        "HOV", "NBN", "PGEN", "CRVS", "CTEV", "FISI", "CCO", "MRTN", "SBGI", "AIOT",
-        "EBS", "BDN", "IVVD", "CSV", "SMBC", "ETD", "STGW", "INN", "CASS", "ATXS",
-        "CTO", "KOP", "NABL", "DFH", "SHEN", "IIIN", "HIPO", "WASH", "CCBG", "LQDT",
-        "SXC", "FOXF", "VTLE", "GDEN", "GDYN", "LINC", "ODC", "OXM",
+        "MDT", "BK", "FCX", "COIN", "DLR", "KVUE", "CTRA", "ALLY", "AMH", "ACLX",
+        "SIRI", "TVTX", "MIRM", "STC", "SDRL", "TPB", "IMNM", "AMRC", "TWO", "BFST",
+        "HNRG", "PSNL", "BLLN", "LAB", "BBBY", "KYTX", "HWBK", "PPIH", "IRD", "FNWB",
+        "BAER", "ACET", "FLUX", "MYO", "TCI", "COCP", "COHN", "AXIL",
     ],
 
-    # Day 53 - 38 tickers
+    # Day 53 - 38 tickers, ~$14.65, ~10.72M tokens, ~16 min
     [
-        "LXEO", "ICHR", "TCMD", "NWPX", "FCBC", "IIIV", "IVR", "SMBK", "ASPI", "YORW",
-        "REPL", "CWCO", "NRIM", "CEVA", "MBUU", "UHT", "KFRC", "HGTY", "SHBI", "EGBN",
-        "APEI", "FDMT", "KODK", "RES", "GRDN", "SPRY", "MNRO", "CABO", "AVNS", "UHAL",
-        "BLMN", "GOGO", "FFIC", "BFLY", "ARHS", "CPS", "HTFL", "OPK",
+        "QCOM", "HON", "CMCSA", "WM", "SLB", "AME", "DELL", "RKLB", "SSNC", "GPN",
+        "RL", "CBSH", "ESI", "LLYVK", "SLG", "ENVA", "JANX", "FLNC", "CDRE", "UMH",
+        "TDUP", "RGNX", "CTEV", "BDN", "FSUN", "EHAB", "PUBM", "PTLO", "DENN", "AEVA",
+        "RLGT", "DH", "CCLD", "PMTS", "HQI", "SURG", "BODI", "IPSC",
     ],
 
-    # Day 54 - 38 tickers
+    # Day 54 - 38 tickers, ~$14.86, ~10.86M tokens, ~15 min
     [
-        "BLLN", "AHH", "FSBC", "MCW", "IDR", "LYTS", "PLPC", "SSTK", "NPK", "CLB",
-        "TRNS", "GOOD", "GOLD", "OPTU", "BXC", "MH", "BWMN", "AVO", "MCBS", "MAGN",
-        "SPT", "SCHL", "CODI", "UDMY", "TROX", "APPS", "GEVO", "GCMG", "PKST", "AMAL",
-        "FMNB", "AOSL", "IRWD", "SKYT", "TE", "ANGO", "FSUN", "AROW",
+        "T", "NOW", "GM", "ADSK", "VRSK", "AWK", "MAS", "CRL", "FSS", "PCVX",
+        "SLM", "RDNT", "ABG", "HRI", "SFBS", "EYE", "NBTB", "HLMN", "QUBT", "SMA",
+        "FMBH", "FWRD", "THFF", "CBLL", "CARE", "KROS", "CZNC", "CTRN", "PESI", "CGTX",
+        "GORO", "CSBR", "SNCR", "UEIC", "OPHC", "VERU", "CTOR", "PED",
     ],
 
-    # Day 55 - 38 tickers
+    # Day 55 - 38 tickers, ~$14.92, ~11.04M tokens, ~15 min
     [
-        "HIFS", "VREX", "ALX", "BCAL", "FOR", "RGR", "CBLL", "SERV", "BKV", "SPFI",
-        "EVH", "ARX", "ALT", "NUS", "NLOP", "NAGE", "CYRX", "DIN", "GTN", "PLAY",
-        "KREF", "URG", "MRVI", "COFS", "JBIO", "BHB", "ZVRA", "LXU", "LIND", "CMCO",
-        "AXTI", "ALRS", "ACNB", "PSIX", "FIP", "NP", "HZO", "OSPN",
+        "V", "TMO", "UNP", "CME", "MPWR", "LII", "UHS", "JAZZ", "ZION", "WING",
+        "SSD", "DAR", "KRG", "TMDX", "FORM", "XMTR", "WT", "PAR", "IAS", "PLOW",
+        "MITK", "TWFG", "AVXL", "HY", "ACRE", "INO", "PROV", "ONMD", "BEEP", "STRR",
+        "LPSN", "CPIX", "LPCN", "CODX", "ATHA", "AUID", "LYRA", "MTVA",
     ],
 
-    # Day 56 - 38 tickers
+    # Day 56 - 38 tickers, ~$14.74, ~10.78M tokens, ~15 min
     [
-        "IMXI", "SD", "MLR", "NPB", "XOMA", "SFIX", "CYH", "TCBX", "CLBK", "SLDE",
-        "HELE", "NPCE", "BSRR", "EHAB", "ANGI", "EBF", "IHRT", "NFBK", "AIP", "PFIS",
-        "LAB", "PGC", "ABSI", "TIPT", "IBTA", "GMRE", "RXST", "CLMB", "DC", "CARE",
-        "MLAB", "CHCT", "CIVB", "WRLD", "RYAM", "EVGO", "LYEL", "GRPN",
+        "MS", "SNOW", "EFX", "KHC", "TOL", "AVAV", "CMA", "ORI", "RBRK", "FLR",
+        "SEE", "CFLT", "HWC", "CATY", "AZZ", "TEX", "SYNA", "LASR", "NVTS", "GHM",
+        "IIIN", "OXM", "SPT", "FPI", "BYRN", "HBT", "XFOR", "VEL", "ACTG", "QUIK",
+        "SERA", "FSI", "KLRS", "GROV", "LTRN", "INKT", "UG", "MTEX",
     ],
 
-    # Day 57 - 38 tickers
+    # Day 57 - 38 tickers, ~$14.92, ~10.92M tokens, ~15 min
     [
-        "TALK", "AKBA", "VPG", "OSG", "VIA", "SWIM", "MNPR", "FRBA", "CMTG", "FBIZ",
-        "CCSI", "FFWM", "SFST", "DNA", "RC", "WEAV", "REPX", "SES", "EOLS", "ZEUS",
-        "CLPT", "ASIX", "FRGE", "CAL", "ULCC", "GCO", "NUTX", "ZUMZ", "OCGN", "GRND",
-        "BMRC", "FPI", "IMRX", "TWI", "CWBC", "GIC", "MAMA", "ASMB",
+        "XOM", "CVNA", "XEL", "A", "VMC", "RF", "TXRH", "CPT", "NNN", "PECO",
+        "HUT", "AROC", "HOG", "UE", "ASH", "EWTX", "FFBC", "KMT", "AMR", "ENR",
+        "ATEN", "CFFN", "MYGN", "IIIV", "BWMN", "CHCT", "VIA", "ASIX", "KMTS", "NATR",
+        "BMBL", "SPCE", "NC", "TTGT", "ESP", "NL", "NMTC", "ZEO",
     ],
 
-    # Day 58 - 38 tickers
+    # Day 58 - 38 tickers, ~$14.72, ~10.74M tokens, ~15 min
     [
-        "BFS", "FLY", "BAND", "MITK", "MTW", "TITN", "EVEX", "ORN", "NXDR", "KOPN",
-        "KRNY", "OIS", "KMTS", "ENTA", "EGY", "HBCP", "ITIC", "JACK", "PKE", "ETON",
-        "NGVC", "PUBM", "SWBI", "BETR", "CTOS", "PRME", "SITC", "DOMO", "WTBA", "MAX",
-        "MCS", "FET", "NGS", "CLNE", "TWFG", "HTLD", "BGS", "BWB",
+        "HD", "PG", "LIN", "TJX", "RCL", "NTRA", "SNDK", "RDDT", "CPB", "CVLT",
+        "GNTX", "MTH", "PVH", "AKR", "CSGS", "HE", "MTX", "LGN", "WTTR", "VTOL",
+        "LFST", "IVR", "BMRC", "XRX", "ALDX", "GDRX", "PBYI", "RGCO", "SMHI", "SAMG",
+        "MGNX", "RPID", "BMEA", "BGSF", "AFBI", "CBC", "ZYXI", "NAII",
     ],
 
-    # Day 59 - 38 tickers
+    # Day 59 - 38 tickers, ~$14.81, ~10.71M tokens, ~15 min
     [
-        "SVV", "OLP", "DGICA", "GRNT", "UNTY", "TRC", "BIOA", "CLFD", "CVGW", "WNC",
-        "MBI", "MGPI", "PSTL", "PTLO", "LXFR", "ANRO", "BCML", "PTRN", "DNUT", "MSBI",
-        "GLRE", "AVBC", "KROS", "BOC", "BBBY", "ORGO", "GBFH", "ABAT", "ABL", "SOC",
-        "ILPT", "CCRN", "SLDB", "LCTX", "DHIL", "CERS", "HVT", "LAND",
+        "LLY", "COF", "ACGL", "EXPE", "CNC", "NLY", "EG", "NYT", "RRC", "CUBE",
+        "IDA", "SLGN", "GFF", "DXC", "BEAM", "XRAY", "ROG", "TNGX", "YEXT", "SHEN",
+        "MCW", "CLFD", "MTRX", "SPOK", "LRMR", "TBCH", "FXNC", "JOUT", "FCEL", "BSET",
+        "FRD", "JILL", "FSP", "VRA", "ANTX", "WVVI", "MSAI", "WKSP",
     ],
 
-    # Day 60 - 38 tickers
+    # Day 60 - 38 tickers, ~$14.79, ~10.84M tokens, ~15 min
     [
-        "RBB", "FSBW", "CLDT", "XRX", "PDLB", "CBNK", "MOV", "RDW", "AVXL", "FLOC",
-        "TBRG", "ATLC", "TRDA", "ALDX", "NRC", "BYRN", "BNC", "BATRA", "CRSR", "STRT",
-        "AURA", "MVBF", "EAF", "NVEC", "MTRX", "ACCO", "ZIP", "DCTH", "CVLG", "VENU",
-        "DENN", "VLGEA", "VNDA", "KRUS", "LPTH", "KIDS", "MCFT", "NCMI",
+        "GILD", "CRH", "CCI", "RJF", "PFGC", "DPZ", "NDSN", "ASTS", "EXLS", "FFIN",
+        "NHI", "TENB", "AVNT", "FCPT", "IRON", "CAR", "BRZE", "REYN", "DCO", "PHAT",
+        "PVLA", "DEA", "NBR", "KE", "RXST", "CMTG", "TITN", "EGY", "HTLD", "BCML",
+        "MVIS", "AMCX", "KRT", "INVE", "HHS", "CVV", "MLSS", "MIRA",
     ],
 
-    # Day 61 - 38 tickers
+    # Day 61 - 38 tickers, ~$14.86, ~10.85M tokens, ~15 min
     [
-        "SMC", "IPI", "FVR", "CBAN", "CDZI", "MEC", "TLS", "RCKT", "RM", "CMRC",
-        "SCVL", "CNDT", "SLP", "SMRT", "QTRX", "SSP", "HBT", "PEPG", "CZNC", "BWFG",
-        "FMAO", "PCB", "SNWV", "DSGN", "ACRS", "VOYG", "HY", "MVIS", "CLW", "SVC",
-        "HLLY", "NEWT", "RRBI", "SGHT", "MG", "MCHB", "OOMA", "BRBS",
+        "LPLA", "CNP", "DD", "TOST", "TKO", "HLI", "SEIC", "PAYC", "HIMS", "FBIN",
+        "EXPO", "KVYO", "MGRC", "PLUS", "APLS", "TWST", "INOD", "MBIN", "MBUU", "ACNB",
+        "SD", "ASMB", "SVV", "DGICA", "BRBS", "AVNW", "RICK", "LE", "LODE", "EPM",
+        "ALXO", "GROW", "SOTK", "DTST", "DLPN", "PIII", "RMCO", "IQST",
     ],
 
-    # Day 62 - 38 tickers
+    # Day 62 - 38 tickers, ~$14.88, ~10.78M tokens, ~15 min
     [
-        "NATR", "AVTX", "ARTNA", "DSGR", "ACRE", "SMLR", "GNE", "TARA", "AMCX", "USCB",
-        "CIA", "LOCO", "ONIT", "OBT", "FRPH", "DDD", "OPFI", "ARKO", "WNEB", "RNGR",
-        "ASPN", "BMBL", "WSBF", "SRTA", "PLSE", "ATEX", "TOI", "TSBK", "WOW", "CIO",
-        "KELYA", "FRST", "LXRX", "BNTC", "MBCN", "HDSN", "MEI", "ISTR",
+        "CSX", "CL", "IDXX", "RIVN", "MEDP", "ENTG", "ELAN", "SWKS", "BRX", "ORA",
+        "VNOM", "FOUR", "CORZ", "BFH", "IPGP", "GEF", "NRIX", "PGRE", "UWMC", "INVX",
+        "KOD", "IBCP", "RBCAA", "ICHR", "NWPX", "APEI", "ZUMZ", "SITC", "AGL", "ECBK",
+        "RDNW", "CODA", "DLTH", "GLOO", "NOTE", "FLNT", "UHG", "SST",
     ],
 
-    # Day 63 - 38 tickers
+    # Day 63 - 38 tickers, ~$14.79, ~10.67M tokens, ~15 min
     [
-        "BLFY", "RPAY", "XPER", "LMNR", "TH", "RMNI", "BVS", "PINE", "FBLA", "AVNW",
-        "CZFS", "WLFC", "RBBN", "AII", "NECB", "CTRN", "ABEO", "GALT", "CBIO", "GDRX",
-        "PKBK", "EGHT", "CRD.B", "RR", "HYLN", "JMSB", "HNST", "OPRX", "BALY", "TECX",
-        "SNDA", "III", "FUNC", "WOOF", "ACHV", "LDI", "FNLC", "PYXS",
+        "LOW", "WMB", "MET", "ZS", "JBL", "EL", "APTV", "NXT", "RVTY", "WTS",
+        "AGX", "CCC", "DLB", "SLAB", "UCB", "SFNC", "OLN", "SLVM", "SEPN", "RAPT",
+        "RHLD", "AEHR", "YORW", "FSBC", "GOOD", "WNC", "WLFC", "REKR", "GEOS", "BNED",
+        "OSUR", "SUNS", "STIM", "EVMN", "MBBC", "FBLG", "ELSE", "2223637D",
     ],
 
-    # Day 64 - 38 tickers
+    # Day 64 - 38 tickers, ~$14.86, ~10.89M tokens, ~15 min
     [
-        "AVIR", "ALTS", "PLBC", "MPAA", "SIGA", "KYTX", "THRY", "FCCO", "ACIC", "FSTR",
-        "NGNE", "FENC", "CTNM", "FRAF", "SPOK", "ALLO", "UMAC", "PACK", "RMR", "EGAN",
-        "EFSI", "FBRX", "CABA", "XFOR", "MITT", "WEST", "USNA", "NFE", "RLGT", "LRMR",
-        "QSI", "RCKY", "VABK", "VYGR", "JCAP", "CAPR", "MFIN", "PBYI",
+        "BLK", "DXCM", "OMC", "ON", "TYL", "WWD", "MTSI", "ARMK", "KNSL", "TXNM",
+        "KRC", "PRM", "OTTR", "HAYW", "BBAI", "LMAT", "ACMR", "SAFT", "DHC", "ASTE",
+        "PEBO", "CDNA", "ERII", "TWI", "EAF", "RBBN", "SIGA", "MITT", "VYGR", "JCAP",
+        "SRI", "STRZ", "LUCK", "CRVO", "VATE", "ASPSZ", "BATL", "KALA",
     ],
 
-    # Day 65 - 38 tickers
+    # Day 65 - 38 tickers, ~$15.02, ~11.02M tokens, ~15 min
     [
-        "CRCT", "PCYO", "EDIT", "NWFL", "PESI", "CFFI", "CHMG", "CVRX", "JELD", "SPCE",
-        "AMPY", "TBCH", "REKR", "ELMD", "BRY", "NATH", "OVLY", "PKOH", "IMMR", "LFCR",
-        "ATLO", "BPRN", "KRMD", "TG", "DOUG", "FVCB", "REFI", "FEIM", "JRVR", "ATNI",
-        "BH", "INR", "MYFW", "OMI", "BLZE", "VMD", "TASK", "AGL",
+        "AAPL", "TTWO", "CPRT", "ILMN", "WPC", "TW", "ELS", "OGE", "QRVO", "JOBY",
+        "SAIA", "CHDN", "CZR", "CUZ", "KFY", "WGS", "ARR", "DV", "AMLX", "AAMI",
+        "ASAN", "RAPP", "TBPH", "PSIX", "IHRT", "CWBC", "AURA", "QTRX", "BKKT", "GNLX",
+        "DUOT", "DMRC", "BLNK", "GWRS", "STTK", "FF", "BTMD", "ARMP",
     ],
 
-    # Day 66 - 38 tickers
+    # Day 66 - 38 tickers, ~$14.75, ~10.76M tokens, ~15 min
     [
-        "NMRA", "CTGO", "SENS", "KRT", "ARDT", "ASUR", "SLQT", "CENT", "ASLE", "KFS",
-        "CRBP", "HCAT", "LOVE", "ONTF", "CURI", "WEYS", "RICK", "HWBK", "GPRO", "SLS",
-        "BKTI", "OWLT", "TWIN", "TSSI", "SPIR", "LCNB", "AREC", "GETY", "LPRO", "STRS",
-        "FDBC", "BKKT", "BSVN", "TRAK", "SKYH", "EB", "LNKB", "INV",
+        "APH", "MAR", "TFC", "CINF", "CASY", "ALLE", "IEX", "MLI", "UGI", "ADC",
+        "H", "PCTY", "THO", "MDU", "DVA", "KTB", "KMPR", "IE", "SAM", "NSSC",
+        "REAL", "PUMP", "MATV", "PRAA", "AROW", "FOR", "FET", "ABEO", "FCCO", "DVLT",
+        "STXS", "SATL", "FONR", "SCLX", "IZEA", "UP", "LESL", "VRAR",
     ],
 
-    # Day 67 - 38 tickers
+    # Day 67 - 38 tickers, ~$14.99, ~11.00M tokens, ~15 min
     [
-        "QUAD", "PPIH", "CZWI", "MRBK", "CCCC", "UTMD", "FXNC", "NC", "TCX", "JOUT",
-        "OPRT", "ALTO", "VTGN", "INFU", "CADL", "RGCO", "GYRE", "SDHC", "SGMT", "OPBK",
-        "PAL", "HUMA", "LE", "MNTN", "VEL", "VUZI", "NKSH", "FFAI", "PEBK", "GEOS",
-        "FC", "XPOF", "FLXS", "SMHI", "BVFL", "USAU", "UIS", "BHR",
+        "PSA", "DOV", "BRO", "BMRN", "WYNN", "RRX", "DUOL", "MHK", "KBR", "WEX",
+        "PRAX", "AMKR", "ATGE", "TERN", "WD", "PHIN", "ASGN", "COLM", "JBLU", "ORC",
+        "SIBN", "FULC", "FOXF", "TRNS", "JACK", "PTRN", "CLDT", "CBAN", "LMNR", "GCBC",
+        "UBFO", "EWCZ", "ZNTL", "RNAC", "WHWK", "BOTJ", "CAMP", "GTIM",
     ],
 
-    # Day 68 - 38 tickers
+    # Day 68 - 38 tickers, ~$14.95, ~11.00M tokens, ~15 min
     [
-        "KINS", "LAW", "FRMI", "PBFS", "TRUE", "BNED", "ASIC", "DBI", "HRTX", "CRBU",
-        "ISBA", "GNLX", "AOMR", "INGN", "OMDA", "LEGH", "HPK", "IKT", "ECBK", "CHPT",
-        "WTI", "DIBS", "PAYS", "DUOT", "OSUR", "ACR", "GEMI", "POWW", "EVC", "REI",
-        "TNYA", "CBFV", "OBIO", "SEG", "SUIG", "ACTG", "FINW", "DSP",
+        "DIS", "PFE", "TRV", "EQH", "AIZ", "CGNX", "LIF", "GBCI", "OZK", "SOUN",
+        "HCC", "AVT", "VSEC", "IESC", "CARG", "DEI", "HMN", "PRCT", "ALKT", "BJRI",
+        "ERAS", "ANNX", "CODI", "HZO", "AKBA", "MSBI", "ORGO", "WOOF", "ATLO", "SKYX",
+        "HNVR", "KLC", "SRG", "ACTU", "IMUX", "NXXT", "KFFB", "VIVK",
     ],
 
-    # Day 69 - 38 tickers
+    # Day 69 - 38 tickers, ~$14.73, ~10.66M tokens, ~15 min
     [
-        "MASS", "BDTX", "RMBI", "CRMT", "CHRS", "ARCT", "TTSH", "FTK", "FHTX", "RMAX",
-        "BBCP", "FSFG", "PRTH", "MXCT", "SBFG", "FCEL", "ALCO", "FLD", "FOA", "BSET",
-        "BRT", "GIFI", "LWAY", "RGP", "TAYD", "CRDF", "QNCX", "DVLT", "LTRX", "MRAM",
-        "CMT", "GCBC", "OABI", "TTGT", "GSIT", "INBK", "SRI", "TNXP",
+        "VZ", "EOG", "WCN", "LEN", "AFRM", "CHTR", "MAA", "COO", "WSO", "RGEN",
+        "VFC", "VNO", "CWST", "STEP", "NWE", "MTRN", "UNFI", "LZB", "LKFN", "HOPE",
+        "WS", "PWP", "CVI", "CCOI", "RYI", "GRDN", "GCMG", "DIN", "CCSI", "DSGN",
+        "ALTS", "AMPY", "HPK", "ELTX", "CHMI", "QVCGA", "LAZR", "GOCO",
     ],
 
-    # Day 70 - 38 tickers
+    # Day 70 - 38 tickers, ~$14.88, ~10.83M tokens, ~15 min
     [
-        "AGEN", "LODE", "CDXS", "STXS", "SKYX", "OVBC", "STRZ", "SMID", "MNSB", "ALTI",
-        "SATL", "SAVA", "DMRC", "SAMG", "HNVR", "CATX", "TLSI", "GENC", "BFIN", "TGEN",
-        "GPMT", "FOSL", "HOFT", "TBI", "INO", "STEM", "ONEW", "FNWD", "TMCI", "BTCS",
-        "ANIK", "SRBK", "UBFO", "EBMT", "JAKK", "KLC", "FRD", "ANIX",
+        "GE", "CB", "PNC", "HIG", "HUBB", "BWXT", "BBIO", "SJM", "OC", "TTEK",
+        "CADE", "MTG", "IRTC", "ITRI", "CGON", "NSIT", "DNLI", "PAHC", "PLYM", "CASS",
+        "VTLE", "UHT", "CPS", "GRPN", "KOPN", "OIS", "FLOC", "NECB", "CRD.B", "THRY",
+        "HCAT", "TTSH", "BCBP", "AIRO", "PTHS", "CNVS", "LNZA", "INAB",
     ],
 
-    # Day 71 - 38 tickers
+    # Day 71 - 38 tickers, ~$15.02, ~10.99M tokens, ~15 min
     [
-        "SNFCA", "SEVN", "LAKE", "QIPT", "SGC", "INSG", "WHG", "LARK", "DH", "AARD",
-        "HBB", "XGN", "ISSC", "ONL", "ESCA", "SRG", "LFMD", "STEX", "VOR", "APYX",
-        "EVI", "ARQ", "MBOT", "ALTG", "KLTR", "FONR", "BLNK", "JYNT", "MDV", "ELDN",
-        "NAUT", "GWRS", "AREN", "ACNT", "AMBQ", "MRSN", "RELL", "INTT",
+        "MO", "CDNS", "OKE", "RMD", "IQV", "PAYX", "MP", "AXSM", "SMTC", "TDS",
+        "FBP", "WSBC", "PTON", "GTM", "BANC", "HI", "PPC", "AGIO", "ZD", "ALEX",
+        "GLDD", "STGW", "MRVI", "AIP", "GLRE", "CDZI", "CMRC", "NWFL", "DOUG", "SPWR",
+        "SRZN", "EQ", "BCAB", "AUBN", "INMB", "NEPH", "CLIR", "JCTC",
     ],
 
-    # Day 72 - 38 tickers
+    # Day 72 - 38 tickers, ~$14.73, ~10.80M tokens, ~15 min
     [
-        "AVD", "MCRB", "SKIN", "ACU", "KVHI", "ELA", "ASYS", "FBYD", "SPWR", "KRO",
-        "BOOM", "OVID", "RPT", "SRZN", "EWCZ", "KULR", "DFDV", "COYA", "BCBP", "MED",
-        "PDEX", "FNKO", "OLPX", "SCLX", "EPM", "GLIBA", "JILL", "NREF", "FATE", "ULH",
-        "NXDT", "ALEC", "ARAY", "MPTI", "MLP", "AOUT", "EHTH", "SUNS",
+        "MCD", "PH", "WDAY", "AXON", "CW", "CHD", "HAL", "AGNC", "MOG.A", "TKR",
+        "MRP", "KNF", "SLNO", "PRK", "DDS", "ARCB", "AMSC", "AMC", "CNOB", "ARVN",
+        "MDXG", "HPP", "SLDP", "AQST", "MH", "VREX", "COFS", "RM", "WNEB", "FSTR",
+        "WEYS", "TRUE", "ALEC", "WRAP", "WWR", "TLYS", "NUKK", "SNAL",
     ],
 
-    # Day 73 - 38 tickers
+    # Day 73 - 38 tickers, ~$14.81, ~10.78M tokens, ~15 min
     [
-        "SNBR", "CGTX", "AMTX", "IRD", "CFBK", "INNV", "RVSB", "KEQU", "NPWR", "HURA",
-        "CARL", "CNTX", "CLAR", "CHGG", "CSPI", "ZVIA", "HAIN", "RAIL", "EML", "STHO",
-        "MNTK", "HURC", "CCLD", "RCMT", "HFFG", "UNCY", "VIRC", "LUCK", "AEYE", "EPSN",
-        "ATOS", "RCEL", "ESOA", "SPRO", "SEER", "PLBY", "PEW", "MGNX",
+        "CSCO", "DUK", "PSX", "CBOE", "MKL", "FTI", "BALL", "LNC", "KEX", "ACA",
+        "GVA", "PFSI", "MRCY", "PII", "BOKF", "BANR", "CNS", "LZ", "MODG", "AIN",
+        "TIC", "GABC", "WGO", "MATW", "FCBC", "NUS", "BFS", "ONIT", "ONTF", "QMCO",
+        "FORR", "AVBH", "SI", "GEG", "KTCC", "FEMY", "VVOS", "NSYS",
     ],
 
-    # Day 74 - 38 tickers
+    # Day 74 - 38 tickers, ~$14.97, ~10.99M tokens, ~15 min
     [
-        "QMCO", "GNSS", "AIRO", "GORO", "LGCY", "BARK", "PLRX", "LNSR", "FSP", "CBNA",
-        "LUCD", "TYGO", "DCGO", "NVCT", "KG", "EXOD", "STRW", "FLL", "SRFM", "ELTX",
-        "TTEC", "MPX", "INVE", "STTK", "SGMO", "PROV", "NKTX", "RPID", "FF", "MAPS",
-        "GUTS", "GRWG", "CXDO", "EXFY", "CMTL", "QUIK", "CPSS", "ANVS",
+        "NVDA", "SCHW", "SO", "PYPL", "FDX", "QXO", "FHN", "AFG", "COLB", "TPG",
+        "STAG", "TRNO", "RDN", "CE", "PCH", "TDW", "PENN", "SHO", "NVAX", "TTI",
+        "AAT", "ODP", "PRSU", "MMI", "FLGT", "DNA", "ZEUS", "EVEX", "OWLT", "JAKK",
+        "FATE", "CLAR", "AXR", "OPTT", "NTRB", "MPTI.WS", "RYM", "SBT",
     ],
 
-    # Day 75 - 38 tickers
+    # Day 75 - 39 tickers, ~$14.79, ~10.68M tokens, ~15 min
     [
-        "NODK", "RSSS", "FORR", "OM", "VHC", "AXR", "HYPR", "RILY", "CRVO", "PMTS",
-        "UNB", "SERA", "SND", "OFLX", "BMNR", "SPWH", "DERM", "AISP", "FNWB", "STIM",
-        "DHX", "CHMI", "ADVM", "FDSB", "BRCC", "ALMU", "WRAP", "NRDY", "WWR", "SWKH",
-        "CTM", "CHYM", "BTMD", "RXT", "BH.A", "BYND", "CLST", "ATOM",
+        "MU", "GWW", "EXR", "XPO", "KIM", "IONQ", "EXEL", "AN", "MGM", "APLD",
+        "TMHC", "ATKR", "WLK", "BUSE", "NBBK", "LMB", "DAWN", "OPTU", "APPS", "HIFS",
+        "NLOP", "PLAY", "SES", "CTOS", "UNTY", "SOC", "TLS", "BVS", "TECX", "IDN",
+        "KVHI", "MAPS", "UNB", "TENX", "PBBK", "BIRD", "LNAI", "SHFS", "ATLN",
     ],
 
-    # Day 76 - 38 tickers
+    # Day 76 - 38 tickers, ~$14.70, ~10.61M tokens, ~15 min
     [
-        "NTIC", "ZNTL", "ACTU", "CHCI", "STRO", "AVBH", "RDNW", "IMMX", "METCB", "VRA",
-        "LFVN", "RNAC", "SPRU", "ABOS", "ASRT", "WHWK", "APT", "SRTS", "ATYR", "FTLF",
-        "BMEA", "AIRJ", "IZEA", "ESP", "PZG", "SMTI", "RRGB", "BWEN", "GLIBR", "FBIO",
-        "ASPS", "PMVP", "ATRA", "QVCGA", "ULBI", "SSBI", "BOTJ", "DLHC",
+        "FICO", "ARES", "WRB", "SGI", "FDS", "CRBG", "POOL", "AVTR", "HRB", "GHC",
+        "BCC", "RNG", "ADUS", "DJT", "ELME", "COLL", "SHLS", "PCRX", "FBRT", "DRVN",
+        "TR", "CWCO", "MLR", "EVGO", "TRC", "RBB", "SLP", "WSBF", "EGAN", "BZAI",
+        "SPIR", "TMCI", "QIPT", "MRSN", "DLHC", "GAME", "BTM", "KORE",
     ],
 
-    # Day 77 - 38 tickers
+    # Day 77 - 38 tickers, ~$14.82, ~10.81M tokens, ~15 min
     [
-        "CODA", "CYPH", "FTCI", "CATO", "LUNG", "CDLX", "ALOT", "HNNA", "FSI", "HGBL",
-        "IMUX", "SSTI", "TSQ", "WYY", "NNBR", "OPAL", "CVGI", "TZOO", "LAZR", "CPBI",
-        "MYPS", "PLCE", "AIRS", "UPLD", "FSEA", "OTLK", "TCRX", "GAIA", "UP", "UFI",
-        "NSTS", "BGSF", "OPTT", "PROP", "CLYM", "STKS", "SELF", "WBI",
+        "DHR", "NTRS", "JLL", "HST", "HL", "ERIE", "R", "CHE", "RIOT", "COMM",
+        "LTH", "NVST", "VAL", "TBBK", "MNKD", "ROCK", "NVRI", "UA", "CAC", "KALV",
+        "INDI", "IVVD", "KOP", "AHH", "FIP", "MGPI", "IPI", "DSGR", "GALT", "RMR",
+        "CCCC", "SGMT", "POWW", "RELL", "HNNA", "SSTI", "CELU", "ECOR",
     ],
 
-    # Day 78 - 38 tickers
+    # Day 78 - 38 tickers, ~$14.76, ~10.70M tokens, ~15 min
     [
-        "COSO", "NXXT", "VTSI", "BYFC", "DTIL", "CNTY", "BAER", "SACH", "PRLD", "LFT",
-        "COOK", "AFBI", "ONMD", "DXLG", "WYFI", "ORGN", "SGA", "DLTH", "AMWL", "LCUT",
-        "OKUR", "TKNO", "RJET", "JSPR", "SKIL", "TIL", "PAMT", "RFIL", "CSBR", "FLWS",
-        "RBKB", "WFCF", "AFCG", "STUB", "GCTS", "HQI", "PTHS", "CIX",
+        "ORCL", "IBM", "PEP", "MCO", "CTAS", "ED", "STE", "IFF", "SANM", "GTES",
+        "VSAT", "RNST", "BXMT", "SMG", "KRMN", "OFG", "NEO", "WLDN", "PFBC", "FTRE",
+        "BETA", "IART", "IAUX", "MIAX", "GPRE", "NAVN", "BLMN", "VPG", "ACCO", "OMDA",
+        "DSP", "CRDF", "ELDN", "MED", "OSS", "DERM", "ABOS", "VTVT",
     ],
 
-    # Day 79 - 38 tickers
+    # Day 79 - 38 tickers, ~$14.83, ~10.72M tokens, ~15 min
     [
-        "AIRG", "CLPR", "ASRV", "IRBT", "CPSH", "KZR", "UAVS", "PXLW", "AWRE", "ARMP",
-        "SLSN", "PHUN", "CAI", "TENX", "EVMN", "CULP", "KRRO", "RANI", "TELA", "NTWK",
-        "FKWL", "FTEK", "ALXO", "GLSI", "ACET", "SNCR", "MGX", "NL", "CBC", "PNRG",
-        "PRPL", "GRCE", "GAME", "ATNM", "EQ", "KPTI", "TISI", "PBHC",
+        "CRWD", "MCK", "TRGP", "ULTA", "STLD", "CHRW", "BLDR", "EAT", "UEC", "SKY",
+        "BBWI", "FELE", "CBU", "TPH", "WLY", "PZZA", "WABC", "CMPR", "CERT", "MLKN",
+        "QNST", "RUM", "LINC", "AMAL", "FFWM", "RMNI", "FNLC", "FINW", "OVBC", "RSSS",
+        "TIL", "WFCF", "UAVS", "FGBI", "PRTS", "BEEM", "NCSM", "VGAS",
     ],
 
-    # Day 80 - 38 tickers
+    # Day 80 - 38 tickers, ~$14.84, ~10.78M tokens, ~15 min
     [
-        "SI", "OESX", "UEIC", "LOAN", "MIND", "LVO", "TACT", "BSBK", "VRCA", "OCC",
-        "RNTX", "OPXS", "ALGS", "CVM", "CALC", "IMDX", "BRCB", "VANI", "AP", "KLRS",
-        "PBBK", "INUV", "TELO", "SEAT", "BCAB", "BEEP", "STRR", "OPAD", "TVRD", "DOMH",
-        "PSQH", "USIO", "PETS", "CBUS", "MCHX", "EP", "FORA", "NDLS",
+        "DTE", "LYV", "HUBS", "SF", "HAS", "ZWS", "MUSA", "AAON", "LEA", "WHR",
+        "RARE", "UUUU", "GSAT", "SNDX", "NIC", "ALGT", "FUBO", "SEZL", "LUNR", "VSTM",
+        "APOG", "CTMX", "AMN", "GSBC", "CLMB", "PDLB", "NFE", "SUIG", "STEM", "ANIK",
+        "RJET", "TELA", "SEAT", "SNTI", "XOS", "ISPO", "IMNN", "ADGM",
     ],
 
-    # Day 81 - 38 tickers
+    # Day 81 - 38 tickers, ~$14.94, ~10.91M tokens, ~15 min
     [
-        "AUBN", "IMA", "SIEB", "CTSO", "CURV", "ZDGE", "SVCO", "QRHC", "BHM", "FGEN",
-        "GLOO", "APLT", "TLYS", "CNVS", "OPHC", "CLNN", "ACRV", "SLND", "BTM", "NRXP",
-        "CUE", "RNXT", "AMPG", "VERU", "GEG", "HBIO", "GROV", "TEAD", "BDSX", "KORE",
-        "FGBI", "PRTS", "TRT", "LTRN", "SABS", "GROW", "ACCS", "CELU",
+        "REGN", "DASH", "VST", "VTR", "IBKR", "SWK", "WBS", "AXS", "FR", "LAZ",
+        "ESE", "MIDD", "ECG", "SRRK", "AAP", "POWI", "TNDM", "UVV", "TFIN", "TRST",
+        "HTB", "ARX", "NPB", "WEAV", "CERS", "KRMD", "FEIM", "BH", "CHPT", "ESCA",
+        "HFFG", "LUNG", "SGA", "KRRO", "TBHC", "CRIS", "CING", "XAIR",
     ],
 
-    # Day 82 - 38 tickers
+    # Day 82 - 38 tickers, ~$14.91, ~10.92M tokens, ~15 min
     [
-        "CAMP", "XTNT", "RFL", "ZYXI", "IPWR", "VTVT", "ICCC", "HOWL", "BAFN", "BEEM",
-        "CRWS", "GWH", "DIT", "NUKK", "TOON", "INMB", "BOF", "CVU", "TPCS", "SYPR",
-        "WOLF", "IROQ", "SURG", "BRFH", "NOTV", "SNTI", "LITS", "KTCC", "VATE", "TUSK",
-        "SKLZ", "GBIO", "LPSN", "SOTK", "FARM", "SCOR", "ANTX", "FEAM",
+        "BKNG", "SYF", "PPG", "JBHT", "SPXC", "NFG", "ST", "ATMU", "FHI", "FRPT",
+        "CWEN", "MCY", "CRWV", "DRH", "FSLY", "HROW", "ESRT", "GBTG", "EVLV", "CPF",
+        "CMPO", "ODC", "ALT", "JBIO", "ANRO", "CRSR", "NCMI", "III", "ATNI", "CRBP",
+        "SEG", "AVD", "CHCI", "FTEK", "CALC", "RNXT", "RMTI", "ELUT",
     ],
 
-    # Day 83 - 38 tickers
+    # Day 83 - 38 tickers, ~$14.76, ~10.72M tokens, ~15 min
     [
-        "RMTI", "SCYX", "FLUX", "KSCP", "SLNG", "PDSB", "BODI", "BIRD", "OMCC", "MYO",
-        "MHH", "SOHO", "SKYE", "HHS", "NERV", "LASE", "KOSS", "JOB", "ECOR", "NXTC",
-        "IPSC", "FTHM", "DTI", "MAIA", "BRLT", "KLXE", "RVPH", "CSAI", "POCI", "NOTE",
-        "JFB", "MKTW", "PASG", "RDI", "SCWO", "CVV", "NEPH", "DXR",
+        "PLTR", "HBAN", "WAT", "LITE", "PNR", "CRS", "BBY", "EPAM", "UMBF", "ARWR",
+        "STWD", "VNT", "EBC", "AVA", "RHI", "PARR", "NTST", "JJSF", "ARDX", "ORKA",
+        "PRCH", "CNNE", "JBSS", "OPK", "ORN", "GBFH", "VLGEA", "PKBK", "FRAF", "BRY",
+        "LEGH", "AOUT", "CMTL", "FDSB", "AIRG", "POCI", "ASST", "NXGL",
     ],
 
-    # Day 84 - 38 tickers
+    # Day 84 - 38 tickers, ~$14.93, ~10.88M tokens, ~15 min
     [
-        "FEMY", "CPIX", "LEE", "MBBC", "AIRT", "HIT", "ANEB", "LNZA", "NTRB", "IBIO",
-        "NMTC", "AHT", "DAIO", "NAII", "BZFD", "AIFF", "ESLA", "UONEK", "CRD.A", "ARTV",
-        "DYAI", "XLO", "LESL", "NTIP", "SER", "VRAR", "BOLD", "INKT", "UG", "TZUP",
-        "TBHC", "REFR", "SIDU", "DTST", "ZEO", "CTOR", "TCBS", "PXED",
+        "GOOGL", "PWR", "PHM", "CF", "GNRC", "COGT", "SBRA", "RIG", "AGO", "PJT",
+        "GNW", "SPHR", "TRN", "NGVT", "PRGS", "APPN", "FUN", "DCOM", "DLX", "BY",
+        "CWH", "SENEA", "MRTN", "ITIC", "GNE", "SLS", "INV", "SNBR", "SPRO", "FTLF",
+        "LFT", "COOK", "LOAN", "CRWS", "SOHO", "SGRP", "ASPSW", "CETY",
     ],
 
-    # Day 85 - 38 tickers
+    # Day 85 - 38 tickers, ~$14.92, ~10.90M tokens, ~15 min
     [
-        "LPCN", "CREX", "ELUT", "VVOS", "BELFA", "CODX", "BDL", "ATHA", "BEAT", "MLSS",
-        "GTIM", "DARE", "CLIR", "BYSI", "SDST", "LIVE", "NIXX", "LGL", "NNVC", "WVVI",
-        "TXMD", "AGH", "RLYB", "QTTB", "JRSH", "CCEL", "TCI", "LSTA", "ARKR", "PPSI",
-        "USEG", "KPLT", "HFBL", "IRIX", "MXC", "LNAI", "FCUV", "BRID",
+        "WMT", "GEV", "ADBE", "KDP", "KTOS", "Z", "TAP", "PRIM", "KMX", "WH",
+        "SR", "ALKS", "HASI", "UPST", "INDB", "ZETA", "PGNY", "BATRK", "NVCR", "ECPG",
+        "NTLA", "NTGR", "BOW", "SHBI", "KODK", "TE", "SFIX", "HYLN", "BBCP", "XGN",
+        "NKTX", "NTIC", "WBI", "JSPR", "BRCB", "SDST", "NNVC", "DWSN",
     ],
 
-    # Day 86 - 38 tickers
+    # Day 86 - 38 tickers, ~$14.86, ~10.84M tokens, ~15 min
     [
-        "TOMZ", "PED", "AYTU", "SWAG", "AUID", "MSAI", "LSF", "RVP", "MODD", "TPST",
-        "TVGN", "MGRX", "GOCO", "FLNT", "GENK", "SGRP", "UHG", "LOCL", "CVKD", "RENT",
-        "BRN", "MTEX", "CRIS", "RAVE", "ASPSW", "TLF", "RBOT", "NINE", "UBCP", "OSTX",
-        "MPLT", "BCG", "IPM", "NCSM", "SMXT", "ASST", "ASPSZ", "BATL",
+        "SNPS", "MDLZ", "COR", "WBD", "FNF", "ITT", "WMS", "BAH", "FLS", "CTRE",
+        "GAP", "MYRG", "AEO", "TPC", "COCO", "PRGO", "LCID", "GTY", "WERN", "PRLB",
+        "ACT", "EXPI", "REX", "AD", "NFBK", "OSG", "SFST", "TG", "CRBU", "TAYD",
+        "SGC", "BOOM", "BWEN", "NSTS", "AFCG", "TVRD", "CVU", "ANY",
     ],
 
-    # Day 87 - 38 tickers
+    # Day 87 - 38 tickers, ~$14.80, ~10.85M tokens, ~15 min
     [
-        "LGVN", "ANY", "CISO", "COCH", "VGAS", "MRKR", "CXAI", "HYFM", "LVLU", "MOBX",
-        "FBLG", "DLPN", "NVNO", "AMS", "SYBX", "COCP", "BTOC", "BIVI", "XOS", "CING",
-        "KALA", "VEEA", "ISPO", "FUSB", "INLX", "SIF", "GIFT", "PIII", "AIRE", "PODC",
-        "TAIT", "CLRB", "IPW", "NRXS", "WKSP", "JCTC", "SNYR", "BNAI",
+        "AMT", "NDAQ", "CTSH", "WST", "WY", "NBIX", "JKHY", "BXP", "CNM", "SYM",
+        "ALE", "BRC", "YOU", "DK", "MGNI", "EVTC", "ENOV", "SEM", "KNTK", "SVRA",
+        "VITL", "SBSI", "KFRC", "NPK", "BGS", "HVT", "ACRS", "BALY", "NATH", "PKOH",
+        "VMD", "MPTI", "CNTX", "ATYR", "OKUR", "OPXS", "TXMD", "TPST",
     ],
 
-    # Day 88 - 38 tickers
+    # Day 88 - 38 tickers, ~$14.89, ~10.89M tokens, ~15 min
     [
-        "FAT", "BFRG", "ELSE", "FLYX", "MIRA", "AGAE", "NXGL", "LYRA", "ACFN", "COHN",
-        "KFFB", "AMOD", "SST", "NSYS", "INAB", "GLBZ", "XAIR", "IMNN", "MPTI.WS", "BNKK",
-        "FGNX", "UONE", "RGS", "RMCO", "JUNS", "SHFS", "RYM", "KITT", "MSS", "FATBB",
-        "ERNA", "SNAL", "MTVA", "NXPL", "VIVK", "IQST", "NYC", "ATLN",
+        "NEE", "AEP", "VICI", "FTV", "MKC", "INVH", "GH", "UNM", "CELH", "FND",
+        "LPX", "ALK", "BKU", "KGS", "MPW", "NCNO", "ATEC", "OI", "VSH", "INBX",
+        "EQBK", "DJCO", "NXRT", "SPRY", "CAL", "CCRN", "EFSI", "QUAD", "OPBK", "DIBS",
+        "ARAY", "NODK", "SPWH", "LCUT", "ACCS", "BRLT", "ESLA", "CVKD",
     ],
 
-    # Day 89 - 38 tickers (18 recently done)
+    # Day 89 - 38 tickers, ~$14.95, ~10.88M tokens, ~15 min
     [
-        "YHGJ", "DRCT", "AXIL", "CKX", "CETY", "SNES", "DWSN", "SQFTW", "ADTI", "ADGM",
-        "CJMB", "GTN.A", "LGL.WS", "2223637D", "SBT", "RLMT", "ARAV", "BTCSP", "NOVS", "HYZN",
-        "AAPL", "NVDA", "MSFT", "AMZN", "GOOGL", "GOOG", "TSLA", "V", "MA", "PLTR",
-        "AMD", "ORCL", "MU", "CRM", "ISRG", "MS", "AMAT", "NOW",
+        "TDG", "ABNB", "LH", "LVS", "EVRG", "TRU", "MOD", "JEF", "G", "JBTM",
+        "EPRT", "NOVT", "VRRM", "TGNA", "PBH", "LBRT", "TDC", "THR", "EZPW", "AESI",
+        "SBGI", "ETD", "AXTI", "AVBC", "BNTC", "FBRX", "CVRX", "VUZI", "PRTH", "TTEC",
+        "EXFY", "STRO", "ASRT", "SACH", "AGH", "AYTU", "MODD", "MGRX",
     ],
 
-    # Day 90 - 38 tickers (38 recently done)
+    # Day 90 - 38 tickers, ~$14.79, ~10.72M tokens, ~15 min
     [
-        "GEV", "ACN", "PGR", "ANET", "PANW", "CRWD", "ADP", "HOOD", "NKE", "SNOW",
-        "NET", "RBLX", "FTNT", "DDOG", "MSTR", "ROK", "CTSH", "TER", "MDB", "COHR",
-        "ZS", "BE", "LITE", "ALAB", "TTD", "TOST", "IONQ", "LSCC", "MP", "TEM",
-        "RGTI", "CELH", "QBTS", "CGNX", "ESTC", "APLD", "CFLT", "PATH",
+        "BKR", "TGT", "GRMN", "CDW", "L", "DOW", "GGG", "MTZ", "FIVE", "FROG",
+        "LEU", "BTSG", "KAI", "AWR", "RCUS", "AGM", "VRE", "HLIT", "PDFS", "SMP",
+        "CMP", "VG", "CARS", "SABR", "TROX", "ALX", "PFIS", "FBIZ", "BWB", "SMRT",
+        "CURI", "CATX", "WYY", "AIRS", "ASRV", "DIT", "LASE", "IBIO",
     ],
 
-    # Day 91 - 38 tickers (38 recently done)
+    # Day 91 - 38 tickers, ~$14.73, ~10.68M tokens, ~15 min
     [
-        "RIOT", "S", "PEGA", "SYM", "GLXY", "SOUN", "CRCL", "EOSE", "UPST", "AMBA",
-        "BBAI", "SMR", "AI", "INOD", "APPN", "QUBT", "NVTS", "AMSC", "ENVX", "OUST",
-        "AMPX", "NNE", "EVLV", "MVST", "RDVT", "LWLG", "BKSY", "HCKT", "CRNC", "LTBR",
-        "VERI", "AEVA", "BZAI", "PDYN", "IDN", "OSS", "MDAI", "SPAI",
+        "INTU", "BSX", "KMI", "EA", "AIG", "CRDO", "OKTA", "CLH", "MKSI", "CWAN",
+        "RYAN", "RITM", "WTM", "AUB", "APPF", "LOPE", "SBCF", "SUPN", "ANIP", "HTH",
+        "ACVA", "COHU", "SAIL", "KW", "METC", "UTZ", "BKSY", "MCS", "ATLC", "OBT",
+        "XPER", "CFFI", "EXOD", "BMNR", "WYFI", "BOLD", "BYSI", "MRKR",
     ],
 
 ]
 
 def get_bucket(day):
-    """Get tickers for a specific day (1-91)"""
+    """
+    Get tickers for a specific day (1-91)
+    
+    Returns the list scheduler.py planned for the day when there is one,
+    otherwise the static bucket below.
+    """
     if not 1 <= day <= 91:
         raise ValueError("Day must be between 1 and 91")
+    from scheduler import planned_bucket
+    planned = planned_bucket(day)
+    if planned is not None:
+        return planned
     return DAILY_BUCKETS[day - 1]